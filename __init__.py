@@ -1,30 +1,52 @@
-import sys
+from importlib import import_module
 
-from pathlib import Path
 
-
-sys.path.append(str(Path(__file__).parent.parent))
-
-from ReverseMap.convert import Convertible, convertible, show
-from ReverseMap.rdict import rdict, rmap
-from ReverseMap.reverse import (
-    ReverseMap,
-    ReverseMapItems,
-    ReverseMapKeys,
-    ReverseMapping,
-    ReverseMapValues,
-)
-
-
-ReverseDict = ReverseMap
-ConvertibleValue = Convertible
-ReverseDictItems = ReverseMapItems
-ReverseDictKeys = ReverseMapKeys
-ReverseDictValues = ReverseMapValues
+# Public names and the (module, attribute) they come from. Submodules are imported on
+# first access, so importing the package or ReverseMap.reverse stays light
+_EXPORTS = {
+    'MISSING': ('reverse', 'MISSING'),
+    'NORMALIZERS': ('normalize', 'NORMALIZERS'),
+    'CompactReverseMap': ('compact', 'CompactReverseMap'),
+    'ConcurrentReverseMap': ('threadsafe', 'ConcurrentReverseMap'),
+    'Convertible': ('convert', 'Convertible'),
+    'ConvertibleValue': ('convert', 'Convertible'),
+    'FreezeCache': ('convert', 'FreezeCache'),
+    'InvertedReverseMap': ('reverse', 'InvertedReverseMap'),
+    'LookupStats': ('reverse', 'LookupStats'),
+    'MappedReverseMap': ('mapped', 'MappedReverseMap'),
+    'ReverseDict': ('reverse', 'ReverseMap'),
+    'ReverseDictItems': ('reverse', 'ReverseMapItems'),
+    'ReverseDictKeys': ('reverse', 'ReverseMapKeys'),
+    'ReverseDictValues': ('reverse', 'ReverseMapValues'),
+    'ReverseMap': ('reverse', 'ReverseMap'),
+    'ReverseMapItems': ('reverse', 'ReverseMapItems'),
+    'ReverseMapKeys': ('reverse', 'ReverseMapKeys'),
+    'ReverseMapValues': ('reverse', 'ReverseMapValues'),
+    'ReverseMapping': ('reverse', 'ReverseMapping'),
+    'ReverseMultiMap': ('multi', 'ReverseMultiMap'),
+    'SharedReverseMap': ('shared', 'SharedReverseMap'),
+    'SharedReverseMapPublisher': ('shared', 'SharedReverseMapPublisher'),
+    'convertible': ('convert', 'convertible'),
+    'disable_freeze_cache': ('convert', 'disable_freeze_cache'),
+    'enable_freeze_cache': ('convert', 'enable_freeze_cache'),
+    'freeze_cache_info': ('convert', 'freeze_cache_info'),
+    'get_normalizer': ('normalize', 'get_normalizer'),
+    'rdict': ('rdict', 'rdict'),
+    'register_freezer': ('convert', 'register_freezer'),
+    'show': ('convert', 'show'),
+}
 
 __all__ = [
+    'MISSING',
+    "NORMALIZERS",
+    'CompactReverseMap',
+    'ConcurrentReverseMap',
     "Convertible",
     'ConvertibleValue',
+    'FreezeCache',
+    'InvertedReverseMap',
+    'LookupStats',
+    'MappedReverseMap',
     'ReverseDict',
     'ReverseDictItems',
     'ReverseDictKeys',
@@ -34,8 +56,29 @@ __all__ = [
     "ReverseMapKeys",
     "ReverseMapValues",
     'ReverseMapping',
+    'ReverseMultiMap',
+    'SharedReverseMap',
+    'SharedReverseMapPublisher',
     'convertible',
+    'disable_freeze_cache',
+    'enable_freeze_cache',
+    'freeze_cache_info',
+    'get_normalizer',
     'rdict',
-    'rmap',
+    'register_freezer',
     'show',
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module}"), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -4,13 +4,18 @@ import sys
 
 from contextlib import contextmanager
 from pathlib import Path
+from shlex import quote
 
-from colorama import Fore, Style
 
+try:
+    from colorama import Fore, Style
+except ImportError:  # colorama only adds color
 
-sys.path.append(str(Path(__file__).absolute().parent))
+    class Fore:
+        BLACK = BLUE = GREEN = RED = YELLOW = ''
 
-from shlex import quote
+    class Style:
+        RESET_ALL = ''
 
 
 def show(
@@ -0,0 +1,656 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from collections.abc import Callable
+from typing import Any
+
+from ReverseMap import convert
+from ReverseMap.compact import CompactReverseMap
+from ReverseMap.convert import Convertible
+from ReverseMap.mapped import MappedReverseMap
+from ReverseMap.multi import ReverseMultiMap
+from ReverseMap.reverse import ReverseMap
+from ReverseMap.shared import SharedReverseMap, SharedReverseMapPublisher
+from ReverseMap.threadsafe import ConcurrentReverseMap
+
+
+def _nested(i: int) -> dict[str, Any]:
+    return {'id': i, 'tags': [f"t{i}", f"u{i}"], 'meta': {'depth': [i, {'x': i}]}}
+
+
+def _nested_list(i: int) -> list[Any]:
+    return [i, [f"t{i}", [i, i + 1]], list(range(8))]
+
+
+def _wide(width: int) -> dict[str, Any]:
+    return {f"k{i}": [i, f"v{i}", None] for i in range(width)}
+
+
+def _deep(depth: int) -> list[Any]:
+    payload: list[Any] = [0]
+    for i in range(depth):
+        payload = [i, payload]
+    return payload
+
+
+def _mixed(size: int) -> list[Any]:
+    return [_nested(i) if i % 3 else _deep(20) for i in range(size)]
+
+
+@dataclass
+class _Record:
+    id: int
+    name: str
+    tags: list[str]
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the best wall time of fn over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def allocated(fn: Callable[[], Any]) -> tuple[Any, int]:
+    """Return fn() and the bytes still allocated by it, as traced by tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def bench_convertible(size: int = 10_000) -> dict[str, float]:
+    """Per-instance memory and time of Convertible construction, hashing and repeated probes."""
+    payloads = [_nested(i) for i in range(size)]
+    instances, nbytes = allocated(lambda: [Convertible(p) for p in payloads])
+    _, hashed_nbytes = allocated(
+        lambda: [c for c in map(Convertible, payloads) if hash(c) is not None]
+    )
+    results = {
+        'bytes_per_instance': nbytes / size,
+        'bytes_per_hashed_instance': hashed_nbytes / size,
+        'construct_us': measure(lambda: [Convertible(p) for p in payloads]) / size * 1e6,
+        'first_hash_us': measure(
+            lambda: [hash(Convertible(p)) for p in payloads]
+        ) / size * 1e6,
+        'rehash_us': measure(lambda: [hash(c) for c in instances]) / size * 1e6,
+    }
+    lists = [Convertible(_nested_list(i)) for i in range(size)]
+    hash(lists[0])
+    results['rehash_list_us'] = measure(lambda: [hash(c) for c in lists]) / size * 1e6
+    return results
+
+
+def bench_freeze() -> dict[str, float]:
+    """Time _freeze on wide, deep and mixed payloads."""
+    payloads = {
+        'wide_10k': _wide(10_000),
+        'deep_200': _deep(200),
+        'mixed_1k': _mixed(1_000),
+        'deep_100k': _deep(100_000),
+    }
+    results = {}
+    for name, payload in payloads.items():
+        try:
+            results[f"{name}_ms"] = measure(lambda: convert._freeze(payload)) * 1e3
+        except RecursionError:
+            results[f"{name}_ms"] = float('nan')
+    return results
+
+
+def bench_custom_types(size: int = 10_000) -> dict[str, float]:
+    """Freeze dataclasses, datetimes and Decimals through their fast paths, against pickling them."""
+    payloads = [
+        (_Record(i, f"n{i}", [f"t{i}"]), datetime.datetime(2024, 1, 1, i % 24), Decimal(i))
+        for i in range(size)
+    ]
+    keys = [convert._freeze(p) for p in payloads]
+    return {
+        'fast_path_us': measure(lambda: [convert._freeze(p) for p in payloads]) / size * 1e6,
+        'pickle_us': measure(
+            lambda: [tuple(map(pickle.dumps, p)) for p in payloads]
+        ) / size * 1e6,
+        'fast_path_hash_us': measure(lambda: [hash(k) for k in keys]) / size * 1e6,
+        'pickle_key_bytes': sum(len(pickle.dumps(x)) for p in payloads for x in p) / size,
+    }
+
+
+def bench_freeze_cache(repeat: int = 2_000) -> dict[str, float]:
+    """Repeated inserts and reverse lookups of the same large config, with and without the freeze cache."""
+    config = {f"section{i}": _nested(i) for i in range(50)}
+
+    def workload():
+        rd = ReverseMap()
+        for i in range(repeat):
+            rd[i] = config
+            rd[config]
+
+    uncached = measure(workload, repeat=3)
+    cache = convert.enable_freeze_cache()
+    try:
+        cached = measure(workload, repeat=3)
+        info = cache.info()
+    finally:
+        convert.disable_freeze_cache()
+    return {
+        'uncached_us': uncached / repeat * 1e6,
+        'cached_us': cached / repeat * 1e6,
+        'hit_rate': info['hits'] / max(info['hits'] + info['misses'], 1),
+    }
+
+
+def bench_compact(size: int = 100_000) -> dict[str, float]:
+    """Memory per entry of int<->int and int<->str pairs in ReverseMap against CompactReverseMap."""
+    results = {}
+    for name, value_type, value in (('int', int, lambda i: i + size), ('str', str, str)):
+        pairs = [(i, value(i)) for i in range(size)]
+        _, layout = allocated(lambda: ReverseMap.from_pairs(pairs))
+        _, compact = allocated(
+            lambda: CompactReverseMap(pairs, value_type=value_type, size_hint=size)
+        )
+        results[f"reversemap_{name}_bytes"] = layout / size
+        results[f"compact_{name}_bytes"] = compact / size
+    return results
+
+
+def bench_get_many(size: int = 100_000) -> dict[str, float]:
+    """Batch lookups through get_many against a loop of single lookups."""
+    rd = ReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+    batch = [i if i % 2 else f"v{i}" for i in range(size)]
+    cm = CompactReverseMap(((i, i + size) for i in range(size)), size_hint=size)
+    ids = list(range(0, 2 * size, 2))
+    results = {
+        'loop_us': measure(lambda: [rd[x] for x in batch], repeat=3) / size * 1e6,
+        'get_many_us': measure(lambda: rd.get_many(batch), repeat=3) / size * 1e6,
+        'compact_loop_us': measure(lambda: [cm.get(x) for x in ids], repeat=3) / size * 1e6,
+        'compact_get_many_us': measure(lambda: cm.get_many(ids), repeat=3) / size * 1e6,
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+    array = np.array(ids, dtype=np.int64)
+    results['compact_numpy_us'] = measure(lambda: cm.get_many(array), repeat=3) / size * 1e6
+    return results
+
+
+def bench_mapped(size: int = 100_000) -> dict[str, float]:
+    """Startup of a worker: opening a compiled file against rebuilding the ReverseMap."""
+    pairs = [(i, f"v{i}") for i in range(size)]
+    rd = ReverseMap.from_pairs(pairs)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.rmap')
+        compile_s = measure(lambda: MappedReverseMap.compile(rd, path).close(), repeat=1)
+        mapped = MappedReverseMap(path)
+        results = {
+            'compile_s': compile_s,
+            'rebuild_ms': measure(lambda: ReverseMap.from_pairs(pairs), repeat=3) * 1e3,
+            'open_ms': measure(lambda: MappedReverseMap(path).close()) * 1e3,
+            'lookup_us': measure(lambda: [mapped[f"v{i}"] for i in range(0, size, 10)])
+            / (size // 10)
+            * 1e6,
+        }
+        mapped.close()
+    return results
+
+
+def bench_shared(size: int = 100_000) -> dict[str, float]:
+    """Attaching a worker to a shared-memory replica against unpickling its own copy."""
+    rd = ReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+    data = pickle.dumps(rd, protocol=pickle.HIGHEST_PROTOCOL)
+    name = f"rmap-bench-{os.getpid()}"
+    with SharedReverseMapPublisher(name) as publisher:
+        publish_s = measure(lambda: publisher.publish(rd), repeat=1)
+        replica = SharedReverseMap(name)
+        results = {
+            'publish_s': publish_s,
+            'unpickle_ms': measure(lambda: pickle.loads(data), repeat=3) * 1e3,
+            'attach_ms': measure(lambda: SharedReverseMap(name).close()) * 1e3,
+            'lookup_us': measure(lambda: [replica[f"v{i}"] for i in range(0, size, 10)])
+            / (size // 10)
+            * 1e6,
+            'swap_ms': measure(
+                lambda: (publisher.publish({'a': 'b'}), replica['b']), repeat=1
+            )
+            * 1e3,
+        }
+        replica.close()
+    return results
+
+
+def bench_stats(size: int = 100_000) -> dict[str, float]:
+    """Per-lookup cost of forward and reverse lookups with stats disabled and enabled."""
+    rd = ReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+    keys = [i if i % 2 else f"v{i}" for i in range(size)]
+
+    def lookups():
+        for key in keys:
+            rd[key]
+
+    results = {'disabled_us': measure(lookups, repeat=3) / size * 1e6}
+    rd.enable_stats()
+    results['enabled_us'] = measure(lookups, repeat=3) / size * 1e6
+    results['p99_ns'] = float(rd.stats()['p99_ns'])
+    rd.disable_stats()
+    return results
+
+
+def bench_misses(size: int = 100_000) -> dict[str, float]:
+    """Per-lookup cost of hits and misses through get, lookup and a caught KeyError."""
+    rd = ReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+    hits = [f"v{i}" for i in range(size)]
+    misses = [f"m{i}" for i in range(size)]
+
+    def caught():
+        for key in misses:
+            try:
+                rd[key]
+            except KeyError:
+                pass
+
+    return {
+        'get_hit_us': measure(lambda: [rd.get(key) for key in hits], repeat=3) / size * 1e6,
+        'get_miss_us': measure(lambda: [rd.get(key) for key in misses], repeat=3) / size * 1e6,
+        'lookup_miss_us': measure(lambda: [rd.lookup(key) for key in misses], repeat=3)
+        / size
+        * 1e6,
+        'getitem_miss_us': measure(caught, repeat=3) / size * 1e6,
+    }
+
+
+# Modules the core import must not load; diagnostics and async helpers import them on use
+HEAVY_IMPORTS = ('ReverseMap._util', 'asyncio', 'colorama', 'concurrent.futures', 'shlex')
+
+
+def import_times(statement: str) -> tuple[float, set[str]]:
+    """
+    Run statement in a fresh interpreter under -X importtime and return the milliseconds
+    spent in the top-level imports it added to startup, with every module it loaded.
+    """
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+
+    def profile(code: str) -> list[tuple[str, int, int]]:
+        stderr = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        ).stderr
+        rows = []
+        for line in stderr.splitlines():
+            if line.startswith('import time:'):
+                _, cumulative, name = line.removeprefix('import time:').split('|')
+                # The header line has labels instead of numbers
+                if cumulative.strip().isdigit():
+                    depth = (len(name) - len(name.lstrip()) - 1) // 2
+                    rows.append((name.strip(), int(cumulative), depth))
+        return rows
+
+    startup = {name for name, _, _ in profile('pass')}
+    rows = profile(statement)
+    total = sum(us for name, us, depth in rows if depth == 0 and name not in startup)
+    return total / 1e3, {name for name, _, _ in rows}
+
+
+def bench_import(repeat: int = 5) -> dict[str, float]:
+    """Cold import of the core map, the package and the full API, with the heavy modules each loads."""
+    results = {}
+    for name, statement in (
+        ('reverse', 'import ReverseMap.reverse'),
+        ('package', 'import ReverseMap'),
+        ('everything', 'from ReverseMap import *'),
+    ):
+        runs = [import_times(statement) for _ in range(repeat)]
+        results[f"{name}_ms"] = min(ms for ms, _ in runs)
+        results[f"{name}_heavy_modules"] = float(len(runs[0][1].intersection(HEAVY_IMPORTS)))
+    return results
+
+
+def bench_multimap(size: int = 100_000, values: int = 1_000) -> dict[str, float]:
+    """All keys of a value through keys_for against scanning the pairs, and rebinding a key."""
+    pairs = [(i, f"v{i % values}") for i in range(size)]
+    rd = ReverseMap.from_pairs(pairs)
+    multi = ReverseMultiMap.from_pairs(pairs)
+    probes = [f"v{i}" for i in range(0, values, values // 10)]
+
+    def rebind():
+        for i in range(size):
+            multi[i] = f"v{(i + 1) % values}"
+
+    return {
+        'scan_ms': measure(
+            lambda: [[k for k, v in dict.items(rd) if v == p] for p in probes], repeat=3
+        )
+        / len(probes)
+        * 1e3,
+        'keys_for_us': measure(lambda: [list(multi.keys_for(p)) for p in probes])
+        / len(probes)
+        * 1e6,
+        'count_us': measure(lambda: [multi.count(p) for p in probes]) / len(probes) * 1e6,
+        'load_reversemap_ms': measure(lambda: ReverseMap.from_pairs(pairs), repeat=3) * 1e3,
+        'load_multimap_ms': measure(lambda: ReverseMultiMap.from_pairs(pairs), repeat=3) * 1e3,
+        'rebind_us': measure(rebind, repeat=1) / size * 1e6,
+    }
+
+
+def bench_pickle(size: int = 20_000) -> dict[str, float]:
+    """Round trip of a ReverseMap through pickle against rebuilding it from its pairs."""
+    rd = ReverseMap.from_pairs((i, _nested(i)) for i in range(size))
+    data = pickle.dumps(rd, protocol=pickle.HIGHEST_PROTOCOL)
+    return {
+        'dumps_ms': measure(lambda: pickle.dumps(rd, protocol=pickle.HIGHEST_PROTOCOL), repeat=3)
+        * 1e3,
+        'loads_ms': measure(lambda: pickle.loads(data), repeat=3) * 1e3,
+        'rebuild_ms': measure(lambda: ReverseMap.from_pairs(dict.items(rd)), repeat=3) * 1e3,
+        'copy_ms': measure(lambda: rd.__copy__(), repeat=3) * 1e3,
+    }
+
+
+def bench_threads(size: int = 10_000, reads: int = 200_000) -> dict[str, float]:
+    """
+    Lock-free read throughput of ConcurrentReverseMap as threads are added, in millions of
+    lookups per second. Reads only scale on a free-threaded build, which gil_enabled reports.
+    """
+    rd = ConcurrentReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+    keys = [i if i % 2 else f"v{i}" for i in range(size)]
+
+    def read():
+        for _ in range(reads // size):
+            for key in keys:
+                rd[key]
+
+    results = {'gil_enabled': float(getattr(sys, '_is_gil_enabled', lambda: True)())}
+    for count in (1, 2, 4, 8):
+
+        def run():
+            threads = [threading.Thread(target=read) for _ in range(count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        results[f"threads_{count}_mops"] = count * reads / measure(run, repeat=3) / 1e6
+    plain = ReverseMap.from_pairs((i, f"v{i}") for i in range(size))
+
+    def read_plain():
+        for _ in range(reads // size):
+            for key in keys:
+                plain[key]
+
+    results['plain_1_mops'] = reads / measure(read_plain, repeat=3) / 1e6
+    return results
+
+
+def bench_aload(size: int = 100_000) -> dict[str, float]:
+    """Longest event loop stall while loading nested values, blocking against aload."""
+    pairs = [(i, _nested(i)) for i in range(size)]
+
+    async def stall(load) -> float:
+        done, gaps = asyncio.Event(), [0.0]
+
+        async def watch():
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0.001)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.sleep(0.01)
+        # Hold the map until the watcher stops, so freeing it is not counted as a stall
+        rd = await load()
+        done.set()
+        await watcher
+        del rd
+        return max(gaps) * 1e3
+
+    async def blocking():
+        return ReverseMap.from_pairs(pairs)
+
+    async def chunked():
+        return await ReverseMap.aload(pairs, chunk_size=1024)
+
+    results = {
+        'blocking_stall_ms': asyncio.run(stall(blocking)),
+        'aload_stall_ms': asyncio.run(stall(chunked)),
+        'aload_s': measure(lambda: asyncio.run(chunked()), repeat=1),
+    }
+    # What is left of the aload stall is full collections, which grow with the heap
+    gc.disable()
+    try:
+        results['aload_stall_gc_off_ms'] = asyncio.run(stall(chunked))
+    finally:
+        gc.enable()
+    return results
+
+
+def bench_parallel(size: int = 100_000) -> dict[str, float]:
+    """
+    from_pairs over nested values in this process against a process pool,
+    with the parent's peak traced memory. Speedup needs free cores, which cpus reports.
+    """
+    pairs = [(i, _wide(8) | {'id': i}) for i in range(size)]
+
+    def peak(fn: Callable[[], Any]) -> float:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    results = {
+        'cpus': float(os.cpu_count() or 1),
+        'serial_s': measure(lambda: ReverseMap.from_pairs(pairs), repeat=1),
+        'serial_peak_mb': peak(lambda: ReverseMap.from_pairs(pairs)),
+    }
+    for workers in (2, 4):
+        results[f"workers_{workers}_s"] = measure(
+            lambda: ReverseMap.from_pairs(pairs, workers=workers), repeat=1
+        )
+    results['workers_4_peak_mb'] = peak(lambda: ReverseMap.from_pairs(pairs, workers=4))
+    return results
+
+
+SCALES = (1_000, 100_000, 1_000_000)
+# A fitted exponent above this is reported as growing faster than linear; cache misses
+# alone push a plain dict pair to about 1.15 between 1e3 and 1e6 entries
+SUPERLINEAR = 1.25
+
+
+def _timed(setup: Callable[[], Any], op: Callable[[Any], Any], repeat: int) -> float:
+    """Best wall time of op(setup()) over repeat runs, leaving setup out of the timing."""
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        op(state)
+        best = min(best, time.perf_counter() - start)
+        del state
+    return best
+
+
+def _operations(size: int) -> dict[str, tuple[Callable[[], Any], Callable[[Any], Any]]]:
+    """
+    The (setup, op) pairs timed by bench_scaling. Each op runs over the whole map,
+    so a linear operation takes time proportional to size.
+    """
+    keys = list(range(size))
+    values = [f"v{i}" for i in keys]
+    upper = [value.upper() for value in values]
+    misses = [f"missing{i}" for i in keys]
+    nested = [[i, f"t{i}"] for i in keys]
+    pairs = list(zip(keys, values))
+
+    def built():
+        return ReverseMap.from_pairs(pairs, size_hint=size)
+
+    def dict_pair():
+        return dict(pairs), dict(zip(values, keys))
+
+    def fill(rd):
+        for key, value in pairs:
+            rd[key] = value
+
+    def fill_pair(maps):
+        forward, reverse = maps
+        for key, value in pairs:
+            forward[key] = value
+            reverse[value] = key
+
+    def delete(rd):
+        for key in keys:
+            del rd[key]
+
+    def nested_lookups(rd):
+        for value in nested:
+            rd[value]
+
+    return {
+        'setitem': (ReverseMap, fill),
+        'getitem_forward': (built, lambda rd: [rd[key] for key in keys]),
+        'getitem_reverse': (built, lambda rd: [rd[value] for value in values]),
+        'contains_hit': (built, lambda rd: [value in rd for value in values]),
+        'contains_miss': (built, lambda rd: [miss in rd for miss in misses]),
+        'delitem': (built, delete),
+        'invert': (built, lambda rd: rd.invert()),
+        'invert_copy': (built, lambda rd: rd.invert(copy=True)),
+        'iterate': (built, lambda rd: [key for key in rd]),
+        'case_insensitive_getitem': (
+            lambda: ReverseMap.from_pairs(pairs, size_hint=size, _case_sensitive=False),
+            lambda rd: [rd[value] for value in upper],
+        ),
+        'nonhashable_setitem': (
+            ReverseMap,
+            lambda rd: [rd.__setitem__(key, value) for key, value in zip(keys, nested)],
+        ),
+        'nonhashable_getitem': (
+            lambda: ReverseMap.from_pairs(zip(keys, nested), size_hint=size),
+            nested_lookups,
+        ),
+        'dict_setitem': (dict, lambda d: [d.__setitem__(key, value) for key, value in pairs]),
+        'dict_getitem': (lambda: dict(pairs), lambda d: [d[key] for key in keys]),
+        'dict_pair_setitem': (lambda: ({}, {}), fill_pair),
+        'dict_pair_getitem_reverse': (dict_pair, lambda maps: [maps[1][v] for v in values]),
+    }
+
+
+def scaling_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """Least-squares slope of log(seconds) against log(size): 1 is linear, 2 quadratic."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return float('nan')
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def bench_scaling(sizes: tuple[int, ...] = SCALES) -> dict[str, dict[str, Any]]:
+    """
+    Time every operation at each size, next to a plain dict and a dict pair,
+    and fit how the time grows with size. Sizes above 100k are timed once.
+    """
+    timings: dict[str, list[float]] = {}
+    for size in sizes:
+        repeat = 1 if size > 100_000 else 3
+        for name, (setup, op) in _operations(size).items():
+            timings.setdefault(name, []).append(_timed(setup, op, repeat))
+    results = {}
+    for name, seconds in timings.items():
+        exponent = scaling_exponent(list(sizes), seconds)
+        results[name] = {
+            'sizes': list(sizes),
+            'seconds': seconds,
+            'ns_per_item': [elapsed / size * 1e9 for elapsed, size in zip(seconds, sizes)],
+            'exponent': exponent,
+            'superlinear': exponent > SUPERLINEAR,
+        }
+    return results
+
+
+def record_scaling(results: dict[str, dict[str, Any]], path: str | os.PathLike) -> None:
+    """Append one JSON line per run to path, so results can be tracked over time."""
+    record = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(record) + '\n')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ReverseMap.")
+    parser.add_argument(
+        '--scaling', action='store_true', help="time every operation at several sizes"
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SCALES))
+    parser.add_argument(
+        '--output', default='bench_results.jsonl', help="file the scaling results are appended to"
+    )
+    args = parser.parse_args()
+    if args.scaling:
+        results = bench_scaling(tuple(args.sizes))
+        for name, result in results.items():
+            per_item = ' '.join(f"{ns:10.1f}" for ns in result['ns_per_item'])
+            flag = '  superlinear' if result['superlinear'] else ''
+            print(f"{name:>26} {per_item} ns/item  exponent {result['exponent']:5.2f}{flag}")
+        record_scaling(results, args.output)
+        return
+    for name, bench in (
+        ('convertible', bench_convertible),
+        ('freeze', bench_freeze),
+        ('custom_types', bench_custom_types),
+        ('freeze_cache', bench_freeze_cache),
+        ('compact', bench_compact),
+        ('get_many', bench_get_many),
+        ('mapped', bench_mapped),
+        ('shared', bench_shared),
+        ('stats', bench_stats),
+        ('misses', bench_misses),
+        ('multimap', bench_multimap),
+        ('pickle', bench_pickle),
+        ('import', bench_import),
+        ('threads', bench_threads),
+        ('aload', bench_aload),
+        ('parallel', bench_parallel),
+    ):
+        for metric, value in bench().items():
+            print(f"{name:>12} {metric:<26} {value:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
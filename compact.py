@@ -0,0 +1,519 @@
+from __future__ import annotations
+import copyreg
+import pickle
+import sys
+
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any
+
+from ReverseMap.convert import _HASH_SEED_PROBE
+
+
+_EMPTY = -1
+_DELETED = -2
+_MIN_BITS = 3
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_MISSING = object()
+
+
+def _bytes(buffer) -> memoryview:
+    """A flat byte view of a pickled buffer, whether it arrived in band or out of band."""
+    return memoryview(buffer).cast('B')
+
+
+class _IntColumn:
+    """A column of signed 64-bit integers."""
+
+    __slots__ = ('_data',)
+    type = int
+
+    def __init__(self):
+        self._data = array('q')
+
+    def append(self, encoded: int) -> None:
+        self._data.append(encoded)
+
+    def get(self, row: int) -> int:
+        return self._data[row]
+
+    def encode(self, value: int) -> int:
+        """Return value as stored, raising OverflowError if it does not fit in 64 bits."""
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise OverflowError(f"{value} does not fit in a signed 64-bit column.")
+        return value
+
+    def matches(self, row: int, probe: int) -> bool:
+        return self._data[row] == probe
+
+    def hash_of(self, row: int) -> int:
+        return hash(self._data[row])
+
+    def take(self, rows: Iterable[int]) -> _IntColumn:
+        column = _IntColumn()
+        data = self._data
+        column._data = array('q', (data[row] for row in rows))
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.itemsize * len(self._data)
+
+    def buffers(self) -> tuple[Any, ...]:
+        return (self._data,)
+
+    @classmethod
+    def restore(cls, data) -> _IntColumn:
+        column = cls()
+        column._data.frombytes(_bytes(data))
+        return column
+
+
+class _StrColumn:
+    """A column of strings stored as UTF-8 in one buffer, addressed by offsets."""
+
+    __slots__ = ('_data', '_offsets')
+    type = str
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array('q', [0])
+
+    def append(self, encoded: bytes) -> None:
+        self._data += encoded
+        self._offsets.append(len(self._data))
+
+    def get(self, row: int) -> str:
+        return self._data[self._offsets[row] : self._offsets[row + 1]].decode()
+
+    def encode(self, value: str) -> bytes:
+        """Return value as stored, raising UnicodeEncodeError for lone surrogates."""
+        return value.encode()
+
+    def matches(self, row: int, probe: bytes) -> bool:
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return end - start == len(probe) and self._data[start:end] == probe
+
+    def hash_of(self, row: int) -> int:
+        return hash(self.get(row))
+
+    def take(self, rows: Iterable[int]) -> _StrColumn:
+        column = _StrColumn()
+        for row in rows:
+            column._data += self._data[self._offsets[row] : self._offsets[row + 1]]
+            column._offsets.append(len(column._data))
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def buffers(self) -> tuple[Any, ...]:
+        return self._data, self._offsets
+
+    @classmethod
+    def restore(cls, data, offsets) -> _StrColumn:
+        column = cls()
+        column._data = bytearray(_bytes(data))
+        column._offsets = array('q')
+        column._offsets.frombytes(_bytes(offsets))
+        return column
+
+
+_COLUMNS = {int: _IntColumn, str: _StrColumn}
+
+
+class _Index:
+    """
+    Open-addressing hash table of row numbers with linear probing.
+    Slots hold a row, _EMPTY, or _DELETED; the column resolves equality.
+    """
+
+    __slots__ = ('_bits', '_filled', '_table')
+
+    def __init__(self, capacity: int = 0):
+        self._bits = max(_MIN_BITS, (max(capacity, 1) - 1).bit_length())
+        self._table = array('q', [_EMPTY]) * (1 << self._bits)
+        self._filled = 0
+
+    def _start(self, h: int) -> int:
+        # Fibonacci hashing spreads sequential integers across the table
+        return ((h & _MASK64) * _GOLDEN & _MASK64) >> (64 - self._bits)
+
+    def find(self, h: int, column, probe, live: bytearray) -> int:
+        """Return the row holding probe, or _EMPTY."""
+        table = self._table
+        mask = len(table) - 1
+        slot = self._start(h)
+        while (row := table[slot]) != _EMPTY:
+            if row != _DELETED and live[row] and column.matches(row, probe):
+                return row
+            slot = (slot + 1) & mask
+        return _EMPTY
+
+    def slot_of(self, h: int, row: int) -> int:
+        """Return the slot holding row, or _EMPTY."""
+        table = self._table
+        mask = len(table) - 1
+        slot = self._start(h)
+        while (found := table[slot]) != _EMPTY:
+            if found == row:
+                return slot
+            slot = (slot + 1) & mask
+        return _EMPTY
+
+    def insert(self, h: int, row: int) -> None:
+        """Store row in the first free slot of its probe sequence."""
+        table = self._table
+        mask = len(table) - 1
+        slot = self._start(h)
+        while table[slot] >= 0:
+            slot = (slot + 1) & mask
+        if table[slot] == _EMPTY:
+            self._filled += 1
+        table[slot] = row
+
+    def replace(self, slot: int, row: int) -> None:
+        self._table[slot] = row
+
+    def remove(self, slot: int) -> None:
+        self._table[slot] = _DELETED
+
+    def needs_resize(self) -> bool:
+        return (self._filled + 1) * 2 > len(self._table)
+
+    @property
+    def nbytes(self) -> int:
+        return self._table.itemsize * len(self._table)
+
+    def buffers(self) -> tuple[Any, ...]:
+        return self._bits, self._filled, self._table
+
+    @classmethod
+    def restore(cls, bits: int, filled: int, table) -> _Index:
+        index = cls.__new__(cls)
+        index._bits = bits
+        index._filled = filled
+        index._table = array('q')
+        index._table.frombytes(_bytes(table))
+        return index
+
+
+class CompactReverseMap(MutableMapping):
+    """
+    A bidirectional map of int or str keys and values stored in typed arrays,
+    with an open-addressing index table for each direction.
+
+    It keeps the ReverseMap lookup API: indexing, ``get`` and ``in`` resolve a key
+    or a value, and ``del`` removes a pair by key or by value. Iteration yields keys.
+    When several keys share a value, reverse lookups resolve to the latest one,
+    and to the latest one left once it is removed.
+
+    Args:
+        pairs: Optional mapping or iterable of (key, value) pairs to load.
+        key_type: Type of the keys, int or str. Defaults to int.
+        value_type: Type of the values, int or str. Defaults to int.
+        size_hint: Expected number of pairs, used to presize the index tables.
+
+    Raises:
+        TypeError: If a key or value does not match its column type.
+        OverflowError: If an int does not fit in 64 bits.
+        UnicodeEncodeError: If a str holds a lone surrogate.
+    """
+
+    def __init__(
+        self,
+        pairs: Iterable[tuple[Any, Any]] | MutableMapping | None = None,
+        *,
+        key_type: type = int,
+        value_type: type = int,
+        size_hint: int = 0,
+    ):
+        if key_type not in _COLUMNS or value_type not in _COLUMNS:
+            raise TypeError("CompactReverseMap stores only int or str keys and values.")
+        self._keys = _COLUMNS[key_type]()
+        self._values = _COLUMNS[value_type]()
+        self._live = bytearray()
+        self._size = 0
+        self._forward = _Index(size_hint * 2)
+        self._reverse = _Index(size_hint * 2)
+        # Row → the row of the same value it replaced in the reverse table
+        self._shadows: dict[int, int] = {}
+        self._sorted: dict[bool, tuple[Any, Any]] = {}
+        if pairs is not None:
+            self.update(pairs)
+
+    @property
+    def key_type(self) -> type:
+        return self._keys.type
+
+    @property
+    def value_type(self) -> type:
+        return self._values.type
+
+    def _find_key(self, key) -> int:
+        if not isinstance(key, self._keys.type):
+            return _EMPTY
+        try:
+            probe = self._keys.encode(key)
+        except (OverflowError, UnicodeEncodeError):
+            # Nothing that cannot be stored is stored
+            return _EMPTY
+        return self._forward.find(hash(key), self._keys, probe, self._live)
+
+    def _find_value(self, value) -> int:
+        if not isinstance(value, self._values.type):
+            return _EMPTY
+        try:
+            probe = self._values.encode(value)
+        except (OverflowError, UnicodeEncodeError):
+            return _EMPTY
+        return self._reverse.find(hash(value), self._values, probe, self._live)
+
+    def _resolve(self, key, default=None):
+        """Resolve key against the keys, then the values."""
+        if (row := self._find_key(key)) != _EMPTY:
+            return self._values.get(row)
+        if (row := self._find_value(key)) != _EMPTY:
+            return self._keys.get(row)
+        return default
+
+    def __getitem__(self, key):
+        if (item := self._resolve(key, _MISSING)) is _MISSING:
+            raise KeyError(f"Key {key} not found in CompactReverseMap.")
+        return item
+
+    def get(self, key, default=None):
+        return self._resolve(key, default)
+
+    def __contains__(self, key) -> bool:
+        return self._find_key(key) != _EMPTY or self._find_value(key) != _EMPTY
+
+    def get_many(self, keys: Iterable, default=None):
+        """
+        Resolve a batch of keys or values in one call, with default for each miss.
+        On an int-to-int map a NumPy integer array is resolved with vectorized
+        binary searches and an array is returned; pass an int default to keep
+        it integer-typed. Other inputs return a list.
+        """
+        return self._get_many(keys, default, forward=True)
+
+    def inverse_get_many(self, values: Iterable, default=None):
+        """
+        Like get_many, but resolve against the values first, then the keys.
+        """
+        return self._get_many(values, default, forward=False)
+
+    def _get_many(self, keys: Iterable, default, forward: bool):
+        # NumPy is only used when the caller already passes its arrays
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(keys, np.ndarray):
+            if (
+                self._keys.type is int
+                and self._values.type is int
+                and keys.dtype.kind in 'iu'
+                and np.can_cast(keys.dtype, np.int64)
+            ):
+                return self._get_many_array(np, keys.astype(np.int64), default, forward)
+            keys = keys.tolist()
+        first, second = (
+            (self._find_key, self._find_value)
+            if forward
+            else (self._find_value, self._find_key)
+        )
+        first_out, second_out = (
+            (self._values.get, self._keys.get)
+            if forward
+            else (self._keys.get, self._values.get)
+        )
+        results = []
+        append = results.append
+        for key in keys:
+            if (row := first(key)) != _EMPTY:
+                append(first_out(row))
+            elif (row := second(key)) != _EMPTY:
+                append(second_out(row))
+            else:
+                append(default)
+        return results
+
+    def _get_many_array(self, np, probes, default, forward: bool):
+        found, result = self._search(np, probes, forward)
+        if not found.all():
+            missed = ~found
+            found[missed], result[missed] = self._search(np, probes[missed], not forward)
+            if not found.all():
+                return np.where(found, result, default)
+        return result
+
+    def _search(self, np, probes, forward: bool):
+        """Return a hit mask and the counterparts of probes on one side."""
+        if (cached := self._sorted.get(forward)) is None:
+            index, column, other = (
+                (self._forward, self._keys, self._values)
+                if forward
+                else (self._reverse, self._values, self._keys)
+            )
+            # Only rows still in the index table resolve, so shadowed values stay hidden
+            rows = np.array(index._table, dtype=np.int64)
+            rows = rows[rows >= 0]
+            values = np.array(column._data, dtype=np.int64)[rows]
+            order = np.argsort(values)
+            cached = self._sorted[forward] = (
+                values[order],
+                np.array(other._data, dtype=np.int64)[rows[order]],
+            )
+        values, counterparts = cached
+        if not len(values):
+            return np.zeros(len(probes), dtype=bool), np.zeros(len(probes), dtype=np.int64)
+        positions = np.searchsorted(values, probes)
+        positions[positions == len(values)] = 0
+        return values[positions] == probes, counterparts[positions]
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, self._keys.type):
+            raise TypeError(f"CompactReverseMap keys must be {self._keys.type.__name__}.")
+        if not isinstance(value, self._values.type):
+            raise TypeError(
+                f"CompactReverseMap values must be {self._values.type.__name__}."
+            )
+        # Encode both sides before touching anything, so a rejected pair leaves no trace
+        encoded_key = self._keys.encode(key)
+        encoded_value = self._values.encode(value)
+        self._sorted.clear()
+        if self._forward.needs_resize() or self._reverse.needs_resize():
+            self._rebuild()
+        previous = self._find_key(key)
+        row = len(self._live)
+        self._keys.append(encoded_key)
+        self._values.append(encoded_value)
+        self._live.append(1)
+        self._size += 1
+        self._forward.insert(hash(key), row)
+        value_hash = hash(value)
+        if (shadowed := self._find_value(value)) != _EMPTY:
+            # The latest key wins the reverse direction
+            self._reverse.replace(self._reverse.slot_of(value_hash, shadowed), row)
+            self._shadows[row] = shadowed
+        else:
+            self._reverse.insert(value_hash, row)
+        if previous != _EMPTY:
+            # Unlinked once the new row is in place, so a rejected overwrite keeps the pair
+            self._unlink(previous)
+
+    def __delitem__(self, key):
+        row = self._find_key(key)
+        if row == _EMPTY and (row := self._find_value(key)) == _EMPTY:
+            raise KeyError(f"Key {key} not found in CompactReverseMap.")
+        self._unlink(row)
+
+    def _unlink(self, row: int) -> None:
+        """Remove a row from both index tables and mark it dead."""
+        slot = self._forward.slot_of(self._keys.hash_of(row), row)
+        self._forward.remove(slot)
+        if (slot := self._reverse.slot_of(self._values.hash_of(row), row)) != _EMPTY:
+            # Hand the value back to the latest live row it replaced
+            survivor = self._shadows.pop(row, _EMPTY)
+            while survivor != _EMPTY and not self._live[survivor]:
+                survivor = self._shadows.pop(survivor, _EMPTY)
+            if survivor != _EMPTY:
+                self._reverse.replace(slot, survivor)
+            else:
+                self._reverse.remove(slot)
+        self._live[row] = 0
+        self._size -= 1
+        self._sorted.clear()
+
+    def _rebuild(self) -> None:
+        """Drop dead rows and rehash both directions into tables sized for the live rows."""
+        rows = [row for row, alive in enumerate(self._live) if alive]
+        self._keys = self._keys.take(rows)
+        self._values = self._values.take(rows)
+        self._live = bytearray(b'\x01') * len(rows)
+        self._forward = _Index(len(rows) * 4)
+        self._reverse = _Index(len(rows) * 4)
+        self._shadows = {}
+        for row in range(len(rows)):
+            self._forward.insert(self._keys.hash_of(row), row)
+            value = self._values.get(row)
+            value_hash = hash(value)
+            if (shadowed := self._find_value(value)) != _EMPTY:
+                self._reverse.replace(self._reverse.slot_of(value_hash, shadowed), row)
+                self._shadows[row] = shadowed
+            else:
+                self._reverse.insert(value_hash, row)
+
+    def __iter__(self) -> Iterator[Any]:
+        keys, live = self._keys, self._live
+        return (keys.get(row) for row in range(len(live)) if live[row])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        keys, values, live = self._keys, self._values, self._live
+        return (
+            (keys.get(row), values.get(row)) for row in range(len(live)) if live[row]
+        )
+
+    def clear(self) -> None:
+        self.__init__(key_type=self._keys.type, value_type=self._values.type)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns and index tables."""
+        return (
+            self._keys.nbytes
+            + self._values.nbytes
+            + len(self._live)
+            + self._forward.nbytes
+            + self._reverse.nbytes
+        )
+
+    def __reduce_ex__(self, protocol: int):
+        """
+        Pickle the columns and index tables as raw buffers, out of band under
+        protocol 5, so loading copies memory instead of re-inserting every pair.
+        """
+        wrap = pickle.PickleBuffer if protocol >= 5 else bytes
+
+        def raw(buffers):
+            return tuple(wrap(b) if isinstance(b, array | bytearray) else b for b in buffers)
+
+        state = (
+            self._keys.type,
+            self._values.type,
+            raw(self._keys.buffers()),
+            raw(self._values.buffers()),
+            wrap(self._live),
+            self._size,
+            raw(self._forward.buffers()),
+            raw(self._reverse.buffers()),
+            self._shadows,
+            _HASH_SEED_PROBE,
+        )
+        return copyreg.__newobj__, (type(self),), state
+
+    def __setstate__(self, state) -> None:
+        key_type, value_type, keys, values, live, size, forward, reverse, shadows, seed_probe = (
+            state
+        )
+        self._keys = _COLUMNS[key_type].restore(*keys)
+        self._values = _COLUMNS[value_type].restore(*values)
+        self._live = bytearray(_bytes(live))
+        self._size = size
+        self._forward = _Index.restore(*forward)
+        self._reverse = _Index.restore(*reverse)
+        self._shadows = shadows
+        self._sorted = {}
+        if seed_probe != _HASH_SEED_PROBE and str in (key_type, value_type):
+            # str slots were placed by another hash seed
+            self._rebuild()
+
+    def __repr__(self) -> str:
+        pairs = ', '.join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"CompactReverseMap({{{pairs}}})"
+
@@ -1,19 +1,144 @@
 from __future__ import annotations
 import sys
 
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 
-sys.path.append(str(Path(__file__).absolute().parent))
 if TYPE_CHECKING:
     import typing
 
 import pickle
+import weakref
 
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from itertools import chain
 
-from ReverseMap._util import show
+
+def show(*msg, **kwds) -> str:
+    """Print a diagnostic through _util.show, which is imported with colorama on first use."""
+    from ReverseMap._util import show
+
+    return show(*msg, **kwds)
+
+
+_UNFROZEN = object()
+# str hashes change with PYTHONHASHSEED; a pickled hash is reused only when this matches
+_HASH_SEED_PROBE = hash('reversemap')
+
+
+class FreezeCache:
+    """
+    Bounded LRU cache of frozen forms, keyed by object identity.
+
+    Entries hold a weak reference to the object when it supports one and a strong
+    reference otherwise, so an identity is never recycled while it is cached. The top-level
+    members of mappings, lists, tuples and sets are kept and compared by identity on every
+    hit, so adding, removing or rebinding a member refreezes the object. Mutations nested
+    deeper are not detected, so nested values must not be mutated in place while the
+    cache is on.
+    """
+
+    __slots__ = ('_entries', 'hits', 'maxsize', 'misses')
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, tuple[typing.Any, tuple | None, typing.Any]] = OrderedDict()
+
+    def get(self, obj, default=None) -> typing.Any:
+        """Return the cached frozen form of obj, or default."""
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None:
+            ref, members, frozen = entry
+            target = ref() if isinstance(ref, weakref.ref) else ref
+            if target is obj and _same_members(members, obj):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return frozen
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, obj, frozen) -> None:
+        """Cache the frozen form of obj, evicting the least recently used entry when full."""
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, lambda ref, key=key: self._evict(key, ref))
+        except TypeError:
+            ref = obj
+        self._entries[key] = (ref, _members(obj), frozen)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _evict(self, key: int, ref: weakref.ref) -> None:
+        """Drop the entry of a collected object, unless its identity was already reused."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return hit and miss counters with the current and maximum size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _members(obj) -> tuple | None:
+    """Return the top-level members of a container: keys and values of a mapping, items otherwise."""
+    if isinstance(obj, Mapping):
+        return tuple(chain.from_iterable(obj.items()))
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return tuple(obj)
+    return None
+
+
+def _same_members(members: tuple | None, obj) -> bool:
+    """Whether obj still holds exactly the cached members, compared by identity in O(width)."""
+    if members is None:
+        return True
+    current = _members(obj)
+    return len(current) == len(members) and all(a is b for a, b in zip(current, members))
+
+
+_freeze_cache: FreezeCache | None = None
+
+
+def enable_freeze_cache(maxsize: int = 1024) -> FreezeCache:
+    """
+    Memoize the frozen forms of non-scalar values by identity, so refreezing
+    the same object skips the recursive walk. Returns the active cache.
+    """
+    global _freeze_cache
+    _freeze_cache = FreezeCache(maxsize)
+    return _freeze_cache
+
+
+def disable_freeze_cache() -> None:
+    """Turn the freeze cache off and drop its entries."""
+    global _freeze_cache
+    _freeze_cache = None
+
+
+def freeze_cache_info() -> dict[str, int] | None:
+    """Return the counters of the active freeze cache, or None when it is disabled."""
+    return None if _freeze_cache is None else _freeze_cache.info()
 
 
 def _freeze(
@@ -28,13 +153,117 @@ def _freeze(
     | frozenset[tuple[typing.Any, typing.Any]]
     | tuple[typing.Any, ...]
 ):
-    """Recursively convert obj into a hashable representation."""
-    if obj is None or isinstance(obj, (int, float, str, bool, bytes)):
-        return obj
-    if isinstance(obj, Mapping):
-        return frozenset((_freeze(k), _freeze(v)) for k, v in obj.items())
-    if isinstance(obj, (list, tuple, set)):
-        return tuple(_freeze(i) for i in obj)
+    """Convert obj into a hashable representation, through the freeze cache when enabled."""
+    if _freeze_cache is None or obj is None or isinstance(obj, _SCALAR_TYPES):
+        return _freeze_value(obj)
+    if (frozen := _freeze_cache.get(obj, _UNFROZEN)) is _UNFROZEN:
+        frozen = _freeze_value(obj)
+        _freeze_cache.put(obj, frozen)
+    return frozen
+
+
+_SCALAR_TYPES = (int, float, str, bool, bytes)
+_SCALAR_TYPE_SET = frozenset({int, float, str, bool, bytes, type(None)})
+
+
+_FREEZERS: dict[type, typing.Callable[[typing.Any], typing.Hashable]] = {}
+_freezer_cache: dict[type, typing.Callable[[typing.Any], typing.Hashable] | None] = {}
+
+
+def register_freezer(
+    cls: type, freezer: typing.Callable[[typing.Any], typing.Hashable]
+) -> None:
+    """
+    Register a function returning the hashable form of instances of cls and its subclasses.
+    Registered freezers take precedence over the built-in fast paths and the pickle fallback.
+    """
+    _FREEZERS[cls] = freezer
+    _freezer_cache.clear()
+
+
+def _freezer_fingerprint() -> tuple[tuple[str, str], ...]:
+    """
+    The registered freezers by type and function name. Processes that registered
+    different freezers freeze some values differently, so their hashes do not mix.
+    """
+    return tuple(
+        sorted(
+            (_type_tag(cls), f"{freezer.__module__}.{freezer.__qualname__}")
+            for cls, freezer in _FREEZERS.items()
+        )
+    )
+
+
+def _type_tag(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _freeze_hashable(obj) -> typing.Any:
+    """Immutable values whose own hash and equality are already value-based."""
+    return obj
+
+
+def _freeze_decimal(obj) -> typing.Any:
+    # NaN decimals are unhashable or hash by identity
+    return ('decimal.Decimal', str(obj)) if obj.is_nan() else obj
+
+
+def _builtin_freezer(cls: type) -> typing.Callable[[typing.Any], typing.Hashable] | None:
+    """
+    Fast paths for enums, datetimes, Decimal and dataclasses.
+    A module that is not imported yet cannot own cls, so these never trigger an import.
+    """
+    if (enum := sys.modules.get('enum')) is not None and issubclass(cls, enum.Enum):
+        tag = _type_tag(cls)
+        return lambda member: (tag, member.name)
+    if (datetime := sys.modules.get('datetime')) is not None and issubclass(
+        cls, (datetime.date, datetime.time, datetime.timedelta)
+    ):
+        return _freeze_hashable
+    if (decimal := sys.modules.get('decimal')) is not None and issubclass(
+        cls, decimal.Decimal
+    ):
+        return _freeze_decimal
+    if (dataclasses := sys.modules.get('dataclasses')) is not None and (
+        dataclasses.is_dataclass(cls)
+    ):
+        tag = _type_tag(cls)
+        names = tuple(field.name for field in dataclasses.fields(cls) if field.compare)
+        return lambda obj: (
+            tag,
+            tuple([_freeze_value(getattr(obj, name)) for name in names]),
+        )
+    return None
+
+
+def _freezer_for(cls: type) -> typing.Callable[[typing.Any], typing.Hashable] | None:
+    """
+    Resolve and cache the freezer of a type: a registered freezer on its MRO, the
+    __reversemap_key__ protocol, then the built-in fast paths.
+    """
+    try:
+        return _freezer_cache[cls]
+    except KeyError:
+        pass
+    freezer = next(
+        (_FREEZERS[klass] for klass in cls.__mro__ if klass in _FREEZERS), None
+    )
+    if freezer is None and callable(getattr(cls, '__reversemap_key__', None)):
+        tag = _type_tag(cls)
+        freezer = lambda obj: (tag, _freeze_value(obj.__reversemap_key__()))  # noqa: E731
+    if freezer is None:
+        freezer = _builtin_freezer(cls)
+    _freezer_cache[cls] = freezer
+    return freezer
+
+
+def _freeze_leaf(obj) -> typing.Any:
+    """
+    Freeze an object that is neither a scalar nor a container, through its type's
+    freezer when it has one.
+    """
+    if (freezer := _freezer_for(type(obj))) is not None:
+        return freezer(obj)
     # Fallback: pickle arbitrary objects to bytes
     try:
         return pickle.dumps(obj)
@@ -43,18 +272,152 @@ def _freeze(
         return repr(obj)
 
 
+def _freeze_value(
+    obj,
+) -> (
+    typing.Any
+    | int
+    | float
+    | str
+    | bool
+    | bytes
+    | frozenset[tuple[typing.Any, typing.Any]]
+    | tuple[typing.Any, ...]
+):
+    """
+    Convert obj into a hashable representation.
+    Mappings become frozensets of frozen pairs, lists, tuples and sets become tuples.
+    Nested containers are walked with an explicit stack, so depth is not bounded by
+    the recursion limit.
+
+    Raises:
+        ValueError: If obj contains itself.
+    """
+    if obj is None or isinstance(obj, _SCALAR_TYPES):
+        return obj
+    if (freezer := _freezer_cache.get(type(obj))) is not None:
+        return freezer(obj)
+    if isinstance(obj, Mapping):
+        items = chain.from_iterable(obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        items = iter(obj)
+    else:
+        return _freeze_leaf(obj)
+    # Each frame is (container, is_mapping, pending items, frozen children)
+    stack = [(obj, isinstance(obj, Mapping), items, [])]
+    active = {id(obj)}
+    scalar_types = _SCALAR_TYPE_SET
+    freezers = _freezer_cache
+    while True:
+        _, is_mapping, items, frozen = stack[-1]
+        append = frozen.append
+        for item in items:
+            if type(item) in scalar_types or item is None:
+                append(item)
+            elif (freezer := freezers.get(type(item))) is not None:
+                append(freezer(item))
+            elif isinstance(item, (list, tuple, set)):
+                if all(type(i) in scalar_types for i in item):
+                    # Flat sequences of scalars freeze without a frame of their own
+                    append(tuple(item))
+                    continue
+                if id(item) in active:
+                    raise ValueError("Cannot freeze a self-referencing container.")
+                active.add(id(item))
+                stack.append((item, False, iter(item), []))
+                break
+            elif isinstance(item, Mapping):
+                if id(item) in active:
+                    raise ValueError("Cannot freeze a self-referencing container.")
+                active.add(id(item))
+                stack.append((item, True, chain.from_iterable(item.items()), []))
+                break
+            elif isinstance(item, _SCALAR_TYPES):
+                append(item)
+            else:
+                append(_freeze_leaf(item))
+        else:
+            container = stack.pop()[0]
+            active.discard(id(container))
+            if is_mapping:
+                pairs = iter(frozen)
+                result = frozenset(zip(pairs, pairs))
+            else:
+                result = tuple(frozen)
+            if not stack:
+                return result
+            stack[-1][3].append(result)
+
+
+def _frozen_equal(left, right) -> bool:
+    """
+    Compare two frozen forms with an explicit stack, for structures too deep for ==.
+    Frozenset members are paired by hash; colliding hashes fall back to ==.
+    """
+    stack = [(left, right)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        if isinstance(a, tuple) and isinstance(b, tuple):
+            if len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+        elif isinstance(a, frozenset) and isinstance(b, frozenset):
+            if len(a) != len(b):
+                return False
+            if len(a) > 1:
+                if hash(a) != hash(b):
+                    return False
+                a, b = sorted(a, key=hash), sorted(b, key=hash)
+                hashes = [hash(member) for member in a]
+                if hashes != [hash(member) for member in b]:
+                    return False
+                if len(set(hashes)) != len(hashes):
+                    if set(a) != set(b):
+                        return False
+                    continue
+            stack.extend(zip(a, b))
+        elif isinstance(a, tuple | frozenset) or isinstance(b, tuple | frozenset):
+            return False
+        elif a != b:
+            return False
+    return True
+
+
 class Convertible:
-    __slots__ = ('_frozen', '_index', '_iterobject', '_original')
+    """
+    Hashable wrapper around an arbitrary object.
+    The frozen form is computed on the first hash or comparison and the hash is cached.
+    """
+
+    __slots__ = ('_frozen', '_hash', '_index', '_iterobject', '_original')
 
     def __init__(self, original):
         self._original = original
-        self._frozen = _freeze(original)
+        self._frozen = _UNFROZEN
+        self._hash = None
         self._index = 0
-        self._iterobject = iter((self.original, self.frozen))
+        self._iterobject = None
+
+    @classmethod
+    def _from_frozen(
+        cls, original, frozen=_UNFROZEN, cached_hash: int | None = None
+    ) -> Convertible:
+        """
+        Wrap original with a frozen form and hash computed elsewhere, such as in a
+        worker process. Either may be left out and is then computed on first use.
+        """
+        wrapped = cls(original)
+        wrapped._frozen = frozen
+        wrapped._hash = cached_hash
+        return wrapped
 
     @property
     def iterobject(self):
-        """Return the iterator object."""
+        """Return the iterator object, created on first use."""
+        if self._iterobject is None:
+            self._iterobject = iter((self.original, self.frozen))
         return self._iterobject
 
     @iterobject.setter
@@ -72,8 +435,10 @@ class Convertible:
 
     @property
     def frozen(self):
-        """Return the frozen representation."""
-        return self._frozen
+        """Return the frozen representation, freezing the original on first access."""
+        if (frozen := self._frozen) is _UNFROZEN:
+            frozen = self._frozen = _freeze(self._original)
+        return frozen
 
     @property
     def total(self) -> int:
@@ -81,14 +446,27 @@ class Convertible:
         return len(self.original)
 
     def __hash__(self) -> int:
-        return hash(self._frozen)
+        if (cached := self._hash) is None:
+            cached = self._hash = hash(self.frozen)
+        return cached
 
     def __eq__(self, other) -> typing.Any | bool:
-        if not isinstance(other, Convertible) and isinstance(
-            other, type(self._original)
+        if not isinstance(other, Convertible):
+            return isinstance(other, type(self._original)) and self.frozen == _freeze(
+                other
+            )
+        if self is other or self._original is other._original:
+            return True
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
         ):
-            return self._frozen == _freeze(other)
-        return isinstance(other, Convertible) and self._frozen == other._frozen
+            return False
+        try:
+            return self.frozen == other.frozen
+        except RecursionError:
+            return _frozen_equal(self.frozen, other.frozen)
 
     def __iter__(self) -> typing.Generator[list[typing.Any], None, None]:
         return self
@@ -112,7 +490,7 @@ class Convertible:
         while True:
             try:
                 self._index += 1
-                next_obj = next(self._iterobject)
+                next_obj = next(self.iterobject)
                 show(f"Next object: {next_obj!r}")
                 if isinstance(next_obj, Convertible):
                     show(f"Next object is Convertible: {next_obj!r}")
@@ -139,7 +517,7 @@ class Convertible:
         | frozenset[tuple[typing.Any, typing.Any]]
         | tuple[typing.Any, ...]
     ):
-        return self._frozen
+        return self.frozen
 
     def revert(self) -> typing.Any:
         """Return the original object."""
@@ -152,7 +530,26 @@ class Convertible:
         return f"Convertible({self._original})"
 
     def __getstate__(self):
-        return self._frozen, self._original
+        """
+        Ship the original with its frozen form and hash, so unpickling does not re-freeze.
+        The hash is only trusted by a process with the same hash seed.
+        """
+        frozen = self._frozen
+        return (
+            self._original,
+            frozen is not _UNFROZEN,
+            None if frozen is _UNFROZEN else frozen,
+            self._hash,
+            _HASH_SEED_PROBE,
+        )
+
+    def __setstate__(self, state):
+        original, is_frozen, frozen, cached_hash, seed_probe = state
+        self._original = original
+        self._frozen = frozen if is_frozen else _UNFROZEN
+        self._hash = cached_hash if seed_probe == _HASH_SEED_PROBE else None
+        self._index = 0
+        self._iterobject = None
 
     # def __get__(self, instance, owner=None):
     #    show(f"Instance - {instance} - Getting Convertible value: {self._original!r}")
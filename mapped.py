@@ -0,0 +1,334 @@
+from __future__ import annotations
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Self
+
+from ReverseMap.convert import Convertible, _freeze_leaf
+from ReverseMap.reverse import ReverseMap
+
+
+_MAGIC = b'RVMAP\x00\x02\x00'
+# magic, pair count, table bits, entries offset, forward offset, reverse offset, blob offset
+_HEADER = struct.Struct('<8sQQQQQQ')
+_FRAME = struct.Struct('<cI')
+_ENTRY_WIDTH = 6  # key offset, key length, key payload length, and the same for the value
+_EMPTY = -1
+_MISSING = object()
+_PLAIN = frozenset({int, str, bytes, type(None)})
+
+
+def _frame(tag: bytes, body: bytes) -> bytes:
+    return _FRAME.pack(tag, len(body)) + body
+
+
+def _encode_scalar(obj) -> bytes | None:
+    """Canonical bytes of a scalar, or None for anything else."""
+    if obj is None:
+        return b'N\x00\x00\x00\x00'
+    if isinstance(obj, str):
+        return _frame(b's', obj.encode())
+    if isinstance(obj, int):
+        return _frame(b'i', str(int(obj)).encode())
+    if isinstance(obj, float):
+        # Integral floats compare and hash equal to ints, so they encode as ints
+        if obj.is_integer():
+            return _frame(b'i', str(int(obj)).encode())
+        return _frame(b'f', repr(obj).encode())
+    if isinstance(obj, bytes):
+        return _frame(b'b', obj)
+    return None
+
+
+def _encode(obj) -> bytes:
+    """
+    Canonical bytes of a key or value, encoded from the original rather than its
+    frozen form, since freezing a set keeps its iteration order, which depends on
+    PYTHONHASHSEED. Equal values encode identically in every process: mappings are
+    sorted sets of (key, value) pairs, sets and frozensets are sorted by member
+    encoding, lists and tuples keep their order, and other leaves encode through
+    their freezer, or by type and repr when it returns them unchanged.
+    Nested containers are walked with an explicit stack.
+
+    Raises:
+        ValueError: If obj contains itself.
+    """
+    if (encoded := _encode_scalar(obj)) is not None:
+        return encoded
+    results: list[bytes] = []
+    # Work items are objects to encode, or markers that close a container
+    work: list[Any] = [obj]
+    active: set[int] = set()
+    while work:
+        item = work.pop()
+        if type(item) is _Close:
+            children = results[len(results) - item.count :]
+            del results[len(results) - item.count :]
+            if item.tag == b'{':
+                children.sort()
+            results.append(_frame(item.tag, b''.join(children)))
+            active.discard(item.ident)
+        elif (encoded := _encode_scalar(item)) is not None:
+            results.append(encoded)
+        elif isinstance(item, Convertible):
+            work.append(item._original)
+        elif isinstance(item, Mapping | list | tuple | set | frozenset):
+            if id(item) in active:
+                raise ValueError("Cannot encode a self-referencing container.")
+            active.add(id(item))
+            if isinstance(item, Mapping):
+                work.append(_Close(b'{', len(item), id(item)))
+                work.extend(reversed(list(item.items())))
+            elif isinstance(item, list | tuple):
+                work.append(_Close(b'(', len(item), id(item)))
+                work.extend(reversed(item))
+            else:
+                work.append(_Close(b'{', len(item), id(item)))
+                work.extend(item)
+        elif (frozen := _freeze_leaf(item)) is not item:
+            work.append(frozen)
+        else:
+            cls = type(item)
+            results.append(_frame(b'o', f"{cls.__module__}.{cls.__qualname__}:{item!r}".encode()))
+    return results[0]
+
+
+class _Close:
+    __slots__ = ('count', 'ident', 'tag')
+
+    def __init__(self, tag: bytes, count: int, ident: int):
+        self.tag = tag
+        self.count = count
+        self.ident = ident
+
+
+def _decode_scalar(encoded: bytes) -> Any:
+    tag, body = encoded[:1], encoded[_FRAME.size :]
+    if tag == b's':
+        return body.decode()
+    if tag == b'i':
+        return int(body)
+    if tag == b'f':
+        return float(body)
+    if tag == b'b':
+        return bytes(body)
+    return None
+
+
+def _canonical(obj) -> bytes:
+    """Canonical bytes of any key or value, wrapped in a Convertible or not."""
+    return _encode(obj._original if isinstance(obj, Convertible) else obj)
+
+
+def _hash(encoded: bytes) -> int:
+    """A hash of canonical bytes that does not depend on PYTHONHASHSEED."""
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'little', signed=True)
+
+
+def _payload(obj) -> bytes:
+    """Pickled obj when its canonical bytes do not decode back to it, else nothing."""
+    if type(obj) in _PLAIN or (type(obj) is float and not obj.is_integer()):
+        return b''
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _table(hashes: Iterable[tuple[int, int]], bits: int) -> array:
+    """Open-addressing table of (hash, row) slots with linear probing."""
+    mask = (1 << bits) - 1
+    table = array('q', [0, _EMPTY]) * (1 << bits)
+    for h, row in hashes:
+        slot = h & mask
+        while table[2 * slot + 1] != _EMPTY:
+            slot = (slot + 1) & mask
+        table[2 * slot] = h
+        table[2 * slot + 1] = row
+    return table
+
+
+def _compile(source: Mapping | Iterable[tuple[Any, Any]]) -> list[bytes | bytearray]:
+    """
+    Encode the pairs of source as the parts of a compiled map, in order:
+    header, entries, forward table, reverse table and blob.
+    """
+    if not isinstance(source, Mapping):
+        source = ReverseMap.from_pairs(source)
+    pairs = dict.items(source) if isinstance(source, dict) else source.items()
+    entries = array('q')
+    blob = bytearray()
+    forward: dict[bytes, tuple[int, int]] = {}
+    reverse: dict[bytes, tuple[int, int]] = {}
+    for row, (key, value) in enumerate(pairs):
+        for obj, index in ((key, forward), (value, reverse)):
+            obj = obj._original if isinstance(obj, Convertible) else obj
+            encoded = _canonical(obj)
+            payload = _payload(obj)
+            entries.extend((len(blob), len(encoded), len(payload)))
+            blob += encoded + payload
+            # Later pairs win a shared canonical form, as they do in a ReverseMap
+            index.pop(encoded, None)
+            index[encoded] = (_hash(encoded), row)
+    if isinstance(source, ReverseMap):
+        reverse = {}
+        for cvalue, key in source._inverse.items():
+            encoded = _canonical(cvalue)
+            reverse[encoded] = (_hash(encoded), forward[_canonical(key)][1])
+    count = len(entries) // _ENTRY_WIDTH
+    bits = max(3, (2 * count).bit_length())
+    forward_table = _table(forward.values(), bits)
+    reverse_table = _table(reverse.values(), bits)
+    entries_offset = _HEADER.size
+    forward_offset = entries_offset + 8 * len(entries)
+    reverse_offset = forward_offset + 8 * len(forward_table)
+    blob_offset = reverse_offset + 8 * len(reverse_table)
+    header = _HEADER.pack(
+        _MAGIC, count, bits, entries_offset, forward_offset, reverse_offset, blob_offset
+    )
+    return [header, entries.tobytes(), forward_table.tobytes(), reverse_table.tobytes(), blob]
+
+
+class MappedReverseMap(Mapping):
+    """
+    A read-only ReverseMap backed by a memory-mapped file.
+
+    The file holds the encoded pairs and an open-addressing hash table for each
+    direction, so opening it only reads the header, and keys and values are decoded
+    when they are looked up. Processes that open the same file share its pages
+    through the OS page cache. Build the file with ``MappedReverseMap.compile``.
+
+    Lookups resolve a key or a value, as in ReverseMap. Values that are not plain
+    scalars are stored pickled, so only open files you trust.
+
+    Args:
+        path: Path of a file written by ``compile``.
+
+    Raises:
+        ValueError: If the file is not a compiled ReverseMap.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self._path = Path(path)
+        with open(self._path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._bind(self._mmap, str(self._path))
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _bind(self, data, label: str) -> None:
+        """Cast views over the tables of a compiled buffer, reading nothing else."""
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{label} is not a compiled ReverseMap.")
+        magic, count, bits, entries, forward, reverse, blob = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError(f"{label} is not a compiled ReverseMap.")
+        view = memoryview(data)
+        slots = 2 << bits
+        self._data = data
+        self._count = count
+        self._mask = (1 << bits) - 1
+        self._entries = view[entries : entries + 8 * _ENTRY_WIDTH * count].cast('q')
+        self._forward = view[forward : forward + 8 * slots].cast('q')
+        self._reverse = view[reverse : reverse + 8 * slots].cast('q')
+        self._blob = blob
+        view.release()
+
+    @classmethod
+    def compile(
+        cls, source: Mapping | Iterable[tuple[Any, Any]], path: str | os.PathLike
+    ) -> Self:
+        """
+        Write the pairs of source to path and open the result.
+        A ReverseMap keeps its own reverse resolution; for other sources the latest
+        key wins a shared value. Pairs that are not a mapping are loaded into a
+        ReverseMap first, so repeated keys collapse as they would there.
+        """
+        with open(path, 'wb') as file:
+            for part in _compile(source):
+                file.write(part)
+        return cls(path)
+
+    def _find(self, table: memoryview, encoded: bytes, side: int) -> int:
+        """Return the row whose key (side 0) or value (side 1) encodes as encoded, or _EMPTY."""
+        h = _hash(encoded)
+        mask = self._mask
+        entries, data, base = self._entries, self._data, self._blob
+        slot = h & mask
+        while (row := table[2 * slot + 1]) != _EMPTY:
+            if table[2 * slot] == h:
+                at = _ENTRY_WIDTH * row + 3 * side
+                start = base + entries[at]
+                if data[start : start + entries[at + 1]] == encoded:
+                    return row
+            slot = (slot + 1) & mask
+        return _EMPTY
+
+    def _decode(self, row: int, side: int) -> Any:
+        at = _ENTRY_WIDTH * row + 3 * side
+        start = self._blob + self._entries[at]
+        length, payload = self._entries[at + 1], self._entries[at + 2]
+        if payload:
+            return pickle.loads(self._data[start + length : start + length + payload])
+        return _decode_scalar(bytes(self._data[start : start + length]))
+
+    def _resolve(self, key, default=None):
+        """Resolve key against the keys, then the values."""
+        encoded = _canonical(key)
+        if (row := self._find(self._forward, encoded, 0)) != _EMPTY:
+            return self._decode(row, 1)
+        if (row := self._find(self._reverse, encoded, 1)) != _EMPTY:
+            return self._decode(row, 0)
+        return default
+
+    def __getitem__(self, key):
+        if (item := self._resolve(key, _MISSING)) is _MISSING:
+            raise KeyError(f"Key {key} not found in MappedReverseMap.")
+        return item
+
+    def get(self, key, default=None):
+        return self._resolve(key, default)
+
+    def get_many(self, keys: Iterable, default=None) -> list[Any]:
+        """Resolve a batch of keys or values in one call, with default for each miss."""
+        resolve = self._resolve
+        return [resolve(key, default) for key in keys]
+
+    def __contains__(self, key) -> bool:
+        encoded = _canonical(key)
+        return (
+            self._find(self._forward, encoded, 0) != _EMPTY
+            or self._find(self._reverse, encoded, 1) != _EMPTY
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._decode(row, 0) for row in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return ((self._decode(row, 0), self._decode(row, 1)) for row in range(self._count))
+
+    def _release(self) -> None:
+        for view in (self._entries, self._forward, self._reverse):
+            view.release()
+
+    def close(self) -> None:
+        """Release the mapping; the map cannot be used afterwards."""
+        self._release()
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedReverseMap({str(self._path)!r}, {self._count} pairs)"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, KeysView
+from typing import Any, Self
+
+from ReverseMap.convert import Convertible, convertible
+from ReverseMap.normalize import Normalizer
+from ReverseMap.reverse import ReverseMap, _original, _probe
+
+
+class ReverseMultiMap(ReverseMap):
+    """
+    A ReverseMap whose reverse side keeps every key that maps to a value.
+
+    Each value has a bucket of its keys in insertion order, so keys_for and count read
+    one bucket instead of scanning the pairs, and rebinding a key moves it between two
+    buckets in O(1). A value still resolves to a single key, the latest one inserted;
+    when that key is removed or rebound, the value falls back to the latest key left.
+    With a normalizer, string values that normalize alike share one bucket, as they
+    share one normalized lookup.
+    """
+
+    def __init__(self, *args, **kwds):
+        self._buckets: dict[Any, dict[Any, None]] = {}
+        super().__init__(*args, **kwds)
+
+    def _slot(self, cvalue: Convertible) -> Any:
+        """The bucket of cvalue: its normalized form for a string under a normalizer."""
+        if self._normalizer is not None and isinstance(original := cvalue._original, str):
+            return self._normalizer(original)
+        return cvalue
+
+    def _index(self, key, value) -> None:
+        cvalue = value if isinstance(value, Convertible) else convertible(value)
+        super()._index(key, cvalue)
+        self._buckets.setdefault(self._slot(cvalue), {})[key] = None
+
+    def _unindex_value(self, key, cvalue: Convertible) -> None:
+        slot = self._slot(cvalue)
+        if (bucket := self._buckets.get(slot)) is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._buckets[slot]
+        super()._unindex_value(key, cvalue)
+
+    def set_normalizer(
+        self, normalizer: str | Normalizer | Iterable[str | Normalizer] | None
+    ) -> Self:
+        """Replace the normalizer, regrouping the buckets by the new normalized forms."""
+        super().set_normalizer(normalizer)
+        self._buckets.clear()
+        for key, cvalue in self._convertible_map.items():
+            self._buckets.setdefault(self._slot(cvalue), {})[_original(key)] = None
+        return self
+
+    def _bucket(self, value) -> dict[Any, None]:
+        if self._normalizer is not None and isinstance(original := _original(value), str):
+            return self._buckets.get(self._normalizer(original), {})
+        return _probe(self._buckets, value, {})
+
+    def keys_for(self, value) -> KeysView:
+        """Return a live view of the keys mapped to value, in insertion order."""
+        return self._bucket(value).keys()
+
+    def count(self, value) -> int:
+        """Return how many keys map to value, without enumerating them."""
+        return len(self._bucket(value))
+
+    def clear(self) -> None:
+        super().clear()
+        self._buckets.clear()
+
+    def __copy__(self) -> ReverseMultiMap:
+        copied = super().__copy__()
+        copied._buckets = {slot: bucket.copy() for slot, bucket in self._buckets.items()}
+        return copied
+
+    def __repr__(self) -> str:
+        return f"ReverseMultiMap({dict.__repr__(self)})"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+import unicodedata
+
+from collections.abc import Callable, Iterable
+
+
+type Normalizer = Callable[[str], str]
+
+
+def casefold(text: str) -> str:
+    """Case-insensitive form of text."""
+    return text.casefold()
+
+
+def nfkc(text: str) -> str:
+    """Unicode NFKC compatibility form of text."""
+    return unicodedata.normalize('NFKC', text)
+
+
+def strip(text: str) -> str:
+    """Text without leading and trailing whitespace."""
+    return text.strip()
+
+
+NORMALIZERS: dict[str, Normalizer] = {
+    'casefold': casefold,
+    'nfkc': nfkc,
+    'strip': strip,
+}
+
+
+class Composed:
+    """
+    Normalizers chained left to right. A module-level class rather than a closure,
+    so maps using it can be pickled, deep-copied and sent to worker processes.
+    """
+
+    __slots__ = ('normalizers',)
+
+    def __init__(self, normalizers: Iterable[Normalizer]):
+        self.normalizers = tuple(normalizers)
+
+    def __call__(self, text: str) -> str:
+        for normalizer in self.normalizers:
+            text = normalizer(text)
+        return text
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Composed):
+            return NotImplemented
+        return self.normalizers == other.normalizers
+
+    def __hash__(self) -> int:
+        return hash(self.normalizers)
+
+    def __reduce__(self):
+        return Composed, (self.normalizers,)
+
+    def __repr__(self) -> str:
+        return f"Composed({self.normalizers!r})"
+
+
+def compose(*normalizers: Normalizer) -> Normalizer:
+    """
+    Chain normalizers, applying them left to right.
+    """
+    return Composed(normalizers)
+
+
+def get_normalizer(spec: str | Normalizer | Iterable[str | Normalizer]) -> Normalizer:
+    """
+    Resolve a normalizer from a registered name, a callable, or a sequence of either.
+
+    Raises:
+        ValueError: If a name is not registered in NORMALIZERS.
+    """
+    if callable(spec):
+        return spec
+    if isinstance(spec, str):
+        try:
+            return NORMALIZERS[spec]
+        except KeyError:
+            raise ValueError(
+                f"Unknown normalizer {spec!r}, expected one of {sorted(NORMALIZERS)}."
+            ) from None
+    return compose(*(get_normalizer(part) for part in spec))
@@ -3,16 +3,11 @@ from __future__ import annotations
 import sys
 
 from collections.abc import Hashable, Mapping, Sequence
-from pathlib import Path
-from typing import Any
-
-
-sys.path.append(str(Path(__file__).absolute().parent))
 from enum import Enum
+from typing import Any
 
-from _util import show
-from convert import Convertible, convertible
-from reverse import ReverseMap
+from ReverseMap.convert import Convertible, convertible, show
+from ReverseMap.reverse import ReverseMap
 
 
 class _KeyType(Enum):
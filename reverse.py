@@ -1,28 +1,276 @@
 from __future__ import annotations
-import sys
+import copyreg
+
+from collections import ChainMap, OrderedDict, deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Reversible,
+)
+from copy import deepcopy
+from itertools import chain, islice
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+from ReverseMap.convert import (
+    _HASH_SEED_PROBE,
+    Convertible,
+    _freeze,
+    _freezer_fingerprint,
+    convertible,
+    show,
+)
+from ReverseMap.normalize import Normalizer, get_normalizer
+
+
+if TYPE_CHECKING:
+    # asyncio and concurrent.futures are imported where they are used, to keep imports light
+    from concurrent.futures import Executor, Future
 
-from pathlib import Path
 
+class ReverseMappingError(Exception):
+    """Custom exception for ReverseMap errors."""
 
-sys.path.append(str(Path(__file__).absolute().parent))
 
-from collections import ChainMap, OrderedDict
-from collections.abc import Iterable, Reversible, Mapping, Iterator, Generator
-from typing import Any, NamedTuple, Self
+_LOAD_BATCH = 1 << 14
+_PARALLEL_CHUNK = 1 << 10
+_MISSING = object()
 
-from ReverseMap.convert import Convertible, convertible
 
-from ReverseMap._util import show
+class _Missing:
+    __slots__ = ()
 
+    def __repr__(self) -> str:
+        return 'MISSING'
+
+
+# Returned by lookup() for a miss, so a stored None can be told apart from no match
+MISSING = _Missing()
+_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
+_INDEX_ATTRIBUTES = frozenset(
+    {
+        '_convertible_map',
+        '_inverse',
+        '_inverse_items',
+        '_inverse_keys',
+        '_inverse_values',
+        '_map',
+        '_normalized_keys',
+        '_normalized_values',
+        '_shadowed',
+        '_shadowed_normalized_keys',
+        '_shadowed_normalized_values',
+    }
+)
+# Per-map state that is not copied or pickled with the map
+_TRANSIENT_ATTRIBUTES = frozenset({'_stats'})
+_TIERS = ('instance', 'convertible_map', 'inverse', 'normalized_keys', 'normalized_values')
+
+
+class LookupStats:
+    """
+    Counters of a ReverseMap's lookups: hits per tier that resolved them, misses,
+    time spent freezing, and latencies in power-of-two nanosecond buckets.
 
-class ReverseMappingError(Exception):
-    """Custom exception for ReverseMap errors."""
+    A map without stats pays one attribute check per lookup. Counters are updated
+    without a lock, so concurrent lookups may lose increments.
+
+    Args:
+        callback: Optional profiler called as callback(tier, elapsed_ns) after each
+            lookup, with tier None for a miss.
+    """
+
+    __slots__ = ('callback', 'freeze_ns', 'freezes', 'hits', 'latency', 'misses')
+
+    def __init__(self, callback: Callable[[str | None, int], Any] | None = None):
+        self.callback = callback
+        self.clear()
+
+    def record(self, tier: str | None, start: int) -> None:
+        """Count a lookup that started at start (perf_counter_ns) and resolved in tier."""
+        elapsed = perf_counter_ns() - start
+        if tier is None:
+            self.misses += 1
+        else:
+            self.hits[tier] += 1
+        self.latency[elapsed.bit_length()] += 1
+        if self.callback is not None:
+            self.callback(tier, elapsed)
+
+    def freeze(self, cvalue: Convertible) -> None:
+        """Hash cvalue now if it is not hashed yet, counting the time spent freezing it."""
+        if cvalue._hash is None:
+            start = perf_counter_ns()
+            hash(cvalue)
+            self.freeze_ns += perf_counter_ns() - start
+            self.freezes += 1
+
+    def percentile(self, q: float) -> int:
+        """Upper bound in nanoseconds of the latency bucket holding the q-th percentile."""
+        total = sum(self.latency)
+        if not total:
+            return 0
+        seen = 0
+        for bits, count in enumerate(self.latency):
+            seen += count
+            if seen * 100 >= q * total:
+                return (1 << bits) - 1
+        return (1 << (len(self.latency) - 1)) - 1
+
+    def clear(self) -> None:
+        self.hits = dict.fromkeys(_TIERS, 0)
+        self.misses = 0
+        self.freeze_ns = 0
+        self.freezes = 0
+        self.latency = [0] * 65
+
+    def info(self) -> dict[str, Any]:
+        """Return the counters, with the latency histogram keyed by bucket upper bound in ns."""
+        return {
+            'hits': dict(self.hits),
+            'misses': self.misses,
+            'lookups': sum(self.hits.values()) + self.misses,
+            'freezes': self.freezes,
+            'freeze_ns': self.freeze_ns,
+            'latency_ns': {
+                (1 << bits) - 1: count for bits, count in enumerate(self.latency) if count
+            },
+            'p50_ns': self.percentile(50),
+            'p99_ns': self.percentile(99),
+        }
+
+
+def _iter_pairs(args, kwds: Mapping) -> Iterator[tuple[Any, Any]]:
+    """
+    Stream (key, value) pairs from dict-style positional and keyword arguments,
+    without materializing an intermediate dictionary.
+    """
+    sources = (args,) if isinstance(args, Mapping) else args
+    if len(sources) > 1:
+        raise TypeError(f"expected at most 1 positional argument, got {len(sources)}")
+    for source in sources:
+        if isinstance(source, Mapping):
+            yield from source.items()
+        elif hasattr(source, "keys"):
+            yield from ((k, source[k]) for k in source.keys())
+        else:
+            yield from source
+    yield from kwds.items()
+
+
+async def _achunks(
+    pairs: AsyncIterable[tuple[Any, Any]] | Iterable[tuple[Any, Any]], size: int
+) -> AsyncIterator[list[tuple[Any, Any]]]:
+    """Group pairs from an async or plain iterable into lists of up to size pairs."""
+    if isinstance(pairs, Mapping):
+        pairs = pairs.items()
+    if not isinstance(pairs, AsyncIterable):
+        iterator = iter(pairs)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+        return
+    chunk = []
+    async for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _freeze_chunk(chunk: list[tuple[Any, Any]]) -> list[tuple[Any, Convertible]]:
+    """Wrap and hash the values of a chunk; runs in an executor, so it must stay picklable."""
+    frozen = [(key, convertible(value)) for key, value in chunk]
+    for _, cvalue in frozen:
+        hash(cvalue)
+    return frozen
+
+
+def _hash_probe() -> tuple[int, tuple[tuple[str, str], ...]]:
+    """What a process's hashes of frozen values depend on: its hash seed and freezers."""
+    return _HASH_SEED_PROBE, _freezer_fingerprint()
+
+
+def _hash_values(values: list[Any]) -> tuple[tuple, list[int]]:
+    """
+    Freeze and hash values in a worker process. Only the hashes come back, since
+    inserting needs nothing else and the frozen forms are as large as the values.
+    The worker's hash probe comes back too, so the parent only trusts hashes from
+    a process seeded like itself and with the same freezers registered.
+    """
+    return _hash_probe(), [hash(_freeze(value)) for value in values]
+
+
+def _freezes_locally(value) -> bool:
+    return type(value) in _SCALARS or isinstance(value, Convertible)
+
+
+def _nth(iterable: Iterable, index: int, name: str) -> Any:
+    """Return the element at a position of a live view without copying it."""
+    size = len(iterable)
+    position = index + size if index < 0 else index
+    if not 0 <= position < size:
+        raise IndexError(f"Index {index} out of range for {name}.")
+    return next(islice(iterable, position, None))
+
+
+def _original(item) -> Any:
+    """Unwrap a Convertible, passing anything else through."""
+    return item._original if isinstance(item, Convertible) else item
+
+
+def _storable(value: Convertible) -> Any:
+    """Return the original of a Convertible when it can be a dict key, else the Convertible."""
+    try:
+        hash(value._original)
+    except TypeError:
+        return value
+    return value._original
+
+
+def _claim(index: dict, shadowed: dict, slot, key) -> None:
+    """Point slot at key, keeping the key it pointed at to fall back to."""
+    if (owner := index.get(slot, _MISSING)) is not _MISSING and owner != key:
+        shadowed.setdefault(slot, {})[owner] = None
+    index[slot] = key
+
+
+def _release(index: dict, shadowed: dict, slot, key) -> None:
+    """Drop key from slot, pointing slot at the latest other key that claimed it."""
+    if index.get(slot, _MISSING) == key:
+        if (bucket := shadowed.get(slot)) is None:
+            del index[slot]
+            return
+        index[slot] = bucket.popitem()[0]
+    elif (bucket := shadowed.get(slot)) is None or bucket.pop(key, _MISSING) is _MISSING:
+        return
+    if not bucket:
+        del shadowed[slot]
+
+
+def _probe(mapping: Mapping, item, default=_MISSING) -> Any:
+    """Look item up by hashing, probing the raw item and then its Convertible form."""
+    original = item.revert() if isinstance(item, Convertible) else item
+    try:
+        if (found := mapping.get(original, _MISSING)) is not _MISSING:
+            return found
+    except TypeError:
+        pass
+    if type(original) in _SCALARS:
+        return default
+    return mapping.get(convertible(item), default)
 
 
 class ReverseMapItem(NamedTuple):
     """
     A named tuple to represent items in ReverseMap.
-    It contains the key and value, both as Convertible.
+    It contains the key and value as stored, either of which may be a Convertible.
     """
 
     key: Convertible
@@ -48,29 +296,30 @@ class ReverseMapItem(NamedTuple):
 class ReverseMapItems(Iterable):
     """
     An iterable class to represent items in ReverseMap.
-    It yields ReverseMapItem instances.
+    It yields ReverseMapItem instances of the stored pairs, as a live view of the mapping.
     """
 
     def __init__(self, reverse_dict: Mapping):
         self._reverse_dict = reverse_dict
-        self._items = [
-            ReverseMapItem(key=k, value=v) for k, v in self._reverse_dict.items()
-        ]
+        self._items = self._reverse_dict.items()
 
     def __contains__(self, item):
         if isinstance(item, Convertible):
-            return item in list(self._items) or item.revert() in list(self._items)
-        return item in list(self._items)
+            item = item.revert()
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, value = item
+        stored = _probe(self._reverse_dict, key)
+        return stored is not _MISSING and convertible(stored) == convertible(value)
 
     def __getitem__(self, item) -> ReverseMapItem:
-        return list(self._items).pop(item)
+        return _nth(self._items, item, "ReverseMapItems")
 
     def __iter__(self) -> Iterator[ReverseMapItem]:
-        for key, value in self._items:
-            yield ReverseMapItem(
-                key=key if isinstance(key, Convertible) else convertible(key),
-                value=value if isinstance(value, Convertible) else convertible(value),
-            )
+        return map(ReverseMapItem._make, self._items)
+
+    def __reversed__(self) -> Iterator[ReverseMapItem]:
+        return map(ReverseMapItem._make, reversed(self._items))
 
     def __len__(self) -> int:
         return len(self._items)
@@ -80,29 +329,24 @@ class ReverseMapItems(Iterable):
 
     def __call__(self, reverse_dict: Mapping) -> ReverseMapItems:
         """
-        Update the ReverseMapItems with a new ReverseMap.
+        Rebind the ReverseMapItems to a new mapping.
+        The items are a live view, so mutations of the bound mapping need no rebind.
         """
         self._reverse_dict = reverse_dict
-        self._items = [
-            ReverseMapItem(key=k, value=v) for k, v in self._reverse_dict.items()
-        ]
+        self._items = self._reverse_dict.items()
         return self
 
     def revert(self):
         """
         Convert the items to radians.
         """
-        return [
-            item.revert()
-            for item in self._items
-            if isinstance(item, Convertible | ReverseMapItem)
-        ]
+        return [item.revert() for item in self]
 
 
 class ReverseMapKeys(Iterable):
     """
     An iterable class to represent keys in ReverseMap.
-    It yields the original keys from the Convertible keys.
+    It yields the original keys from the Convertible keys, as a live view of the mapping.
     """
 
     def __init__(self, reverse_dict: Mapping):
@@ -110,26 +354,23 @@ class ReverseMapKeys(Iterable):
         self._keys = self._reverse_dict.keys()
 
     def __iter__(self) -> Iterator[Any]:
-        return iter(self._keys)
+        return map(_original, self._keys)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return map(_original, reversed(self._keys))
 
     def __len__(self) -> int:
         return len(self._keys)
 
     def __contains__(self, item) -> bool:
-        if isinstance(item, Convertible):
-            return (item.revert()) in list(self) or item in list(self)
-        return item in list(self)
+        return _probe(self._reverse_dict, item) is not _MISSING
 
     def __getitem__(self, item) -> Any:
-        try:
-            return list(self._keys).pop(item)
-        except IndexError:
-            raise IndexError(f"Index {item} out of range for ReverseMapKeys.") from None
-        except TypeError:
-            try:
-                return list(self._keys).pop(list(self._keys).index(item))
-            except ValueError:
-                raise ValueError(f"Item {item} not found in ReverseMapKeys.") from None
+        if isinstance(item, int):
+            return _nth(self._keys, item, "ReverseMapKeys")
+        if item in self:
+            return item
+        raise ValueError(f"Item {item} not found in ReverseMapKeys.")
 
     def __str__(self) -> str:
         return f"ReverseMapKeys({list(self._reverse_dict.keys())})"
@@ -143,46 +384,56 @@ class ReverseMapKeys(Iterable):
 class ReverseMapValues(Iterable):
     """
     An iterable class to represent values in ReverseMap.
-    It yields the original values from the Convertible values.
+    It yields the original values from the Convertible values, as a live view of the mapping.
     """
 
-    def __init__(self, reverse_dict: Mapping):
+    def __init__(self, reverse_dict: Mapping, index: Mapping | None = None):
+        """
+        Args:
+            reverse_dict: The mapping whose values are viewed.
+            index: Optional mapping from each Convertible value back to its key in reverse_dict,
+                used to answer membership by hashing instead of scanning.
+        """
         self._reverse_dict = reverse_dict
         self._values = self._reverse_dict.values()
+        self._index = index
 
-    def __iter__(self) -> Generator[Any, Any, None]:
-        for value in list(self._values):
-            yield value.revert() if isinstance(value, Convertible) else value
+    def __iter__(self) -> Iterator[Any]:
+        return map(_original, self._values)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return map(_original, reversed(self._values))
 
     def __len__(self) -> int:
         return len(self._values)
 
     def __contains__(self, item) -> bool:
-        if isinstance(item, Convertible):
-            return (item.revert()) in self._values or item in self._values
-        return item in self._values
+        if self._index is None:
+            if isinstance(item, Convertible):
+                return (item.revert()) in self._values or item in self._values
+            return item in self._values
+        key = self._index.get(convertible(item), _MISSING)
+        if key is _MISSING:
+            return False
+        stored = self._reverse_dict.get(key, _MISSING)
+        return stored is not _MISSING and convertible(stored) == convertible(item)
 
     def __getitem__(self, item) -> Any:
-        try:
-            return list(self._values).pop(item)
-        except IndexError:
-            raise IndexError(
-                f"Index {item} out of range for ReverseMapValues."
-            ) from None
-        except TypeError:
-            try:
-                return list(self._values).pop(list(self._values).index(item))
-            except ValueError:
-                raise ValueError(
-                    f"Item {item} not found in ReverseMapValues."
-                ) from None
+        if isinstance(item, int):
+            return _nth(self._values, item, "ReverseMapValues")
+        if item in self:
+            return item
+        raise ValueError(f"Item {item} not found in ReverseMapValues.")
 
     def __str__(self) -> str:
         return f"ReverseMapValues({list(self._values)})"
 
-    def __call__(self, reverse_dict: Mapping) -> ReverseMapValues:
+    def __call__(
+        self, reverse_dict: Mapping, index: Mapping | None = None
+    ) -> ReverseMapValues:
         self._reverse_dict = reverse_dict
         self._values = self._reverse_dict.values()
+        self._index = index
         return self
 
 
@@ -195,6 +446,10 @@ class ReverseMap(dict, Reversible):
         **kwargs: Keyword arguments to initialize the dictionary.
     Attributes:
         _case_sensitive (bool): Whether the keys are case-sensitive. Defaults to True.
+            Case-insensitive maps normalize string keys and values with casefold.
+        _normalizer (str | Callable | Sequence): Normalizer applied to string keys and values
+            for format-insensitive lookups, by name ('casefold', 'nfkc', 'strip'), callable,
+            or a sequence of either. Defaults to None.
         _verbose (bool): Whether to print verbose output during lookups. Defaults to False.
 
     Raises:
@@ -209,10 +464,11 @@ class ReverseMap(dict, Reversible):
     """
 
     case_sensitive = True
+    _normalizer: Normalizer | None = None
+    _stats: LookupStats | None = None
     _verbose = False
 
     def __init__(self, *args, **kwds):
-        self._caller = None
         _mydict = kwds.copy()
         for k, v in _mydict.items():
             if isinstance(k, str) and k.startswith('_'):
@@ -224,8 +480,6 @@ class ReverseMap(dict, Reversible):
                 else:
                     setattr(self, k, kwds.pop(k))
         del _mydict
-        self.case_sensitive = kwds.pop('_case_sensitive', True)
-        self._verbose = kwds.pop('_verbose', False)
         if self._verbose:
             show(
                 "ARGS TYPE:",
@@ -239,18 +493,8 @@ class ReverseMap(dict, Reversible):
                 term=True,
             )
         if not self.case_sensitive:
-            # Convert all keys to lowercase if case sensitivity is off
+            # Keys keep their case; lookups go through the normalized shadow index
             if (
-                args
-                and isinstance(args, tuple)
-                and len(args) == 1
-                and isinstance(args[0], dict | zip)
-            ):
-                args = OrderedDict(
-                    (k.casefold(), v) if isinstance(k, str) else (k, v)
-                    for k, v in dict(args[0]).items()
-                )
-            elif (
                 args
                 and isinstance(args, tuple)
                 and len(args) == 1
@@ -265,197 +509,496 @@ class ReverseMap(dict, Reversible):
                 and isinstance(args[1], list | tuple | set | frozenset)
             ):
                 args = OrderedDict((str(k), v) for k, v in zip(args[0], args[1]))
-            elif args and isinstance(args, dict | zip):
-                args = OrderedDict(
-                    (k.lower(), v) if isinstance(k, str) else (k, v)
-                    for k, v in dict(args).items()
-                )
-            if kwds:
-                for k, v in kwds.items():
-                    if isinstance(k, str):
-                        k = k.casefold()
-                    kwds[k] = v
         if self._verbose:
             show(
                 f"Initializing ReverseMap with args: {args} and kwds: {kwds}",
                 color="blue",
                 term=True,
             )
-        super().__init__(*args, **kwds)
-        self._inverse = OrderedDict(
-            {
-                convertible(v): k
-                for k, v in self.items()
-                if not isinstance(v, Convertible)
-            }
-        )
+        super().__init__()
+        self._inverse = OrderedDict()
+        self._convertible_map = OrderedDict()
+        # Earlier keys of values shared by several keys, for when the latest one goes
+        self._shadowed: dict[Convertible, dict[Any, None]] = {}
+        self._bind_views()
+        self._normalized_keys: dict[str, Any] = {}
+        self._normalized_values: dict[str, Any] = {}
+        self._shadowed_normalized_keys: dict[str, dict[Any, None]] = {}
+        self._shadowed_normalized_values: dict[str, dict[Any, None]] = {}
+        normalizer = self._normalizer or (None if self.case_sensitive else 'casefold')
+        self._normalizer = get_normalizer(normalizer) if normalizer else None
+        self._load(_iter_pairs(args, kwds))
+
+    def _bind_views(self) -> None:
+        """Create the views and the ChainMap over the current reverse indexes."""
         self._inverse_keys: ReverseMapKeys = ReverseMapKeys(self._inverse)
-        self._inverse_values = ReverseMapValues(self._inverse)
+        self._inverse_values = ReverseMapValues(self._inverse, self._convertible_map)
         self._inverse_items = ReverseMapItems(self._inverse)
-        self._convertible_map = OrderedDict(
-            {convertible(v): k for k, v in self._inverse_items}
-        )
         self._map = ChainMap(self, self._convertible_map, self._inverse)
 
-    def __setitem__(self, key, value):
-        super().__setitem__(key, value)
-        self._inverse[convertible(value)] = key
-        self._inverse_keys = self._inverse_keys(self._inverse)
-        self._inverse_values = self._inverse_values(self._inverse)
-        self._inverse_items = self._inverse_items(self._inverse)
-        if not isinstance(key, Convertible):
-            key = convertible(key)
-        if not isinstance(value, Convertible):
-            value = convertible(value)
-        self._convertible_map[key] = value
-        self._map = ChainMap(self, self._convertible_map, self._inverse)
+    def __getstate__(self):
+        """
+        The forward pairs, the reverse indexes with the frozen forms and hashes of
+        their Convertibles, and the remaining attributes. Views are rebuilt, not shipped.
+        """
+        attributes = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _INDEX_ATTRIBUTES and name not in _TRANSIENT_ATTRIBUTES
+        }
+        return (
+            dict(dict.items(self)),
+            self._convertible_map,
+            self._inverse,
+            self._normalized_keys,
+            self._normalized_values,
+            self._shadowed,
+            self._shadowed_normalized_keys,
+            self._shadowed_normalized_values,
+            attributes,
+        )
 
-    def __getitem__(self, key):
-        item = None
-        loc = None
-        check_items = [
-            key.revert() if isinstance(key, Convertible) else key,
-            convertible(key) if not isinstance(key, Convertible) else key,
-        ]
-        if not self.case_sensitive and isinstance(key, str):
-            # Check for case-insensitive keys
-            check_items.extend(
-                [
-                    key.casefold(),
-                    key.upper(),
-                    key.title(),
-                ]
-            )
-        if (
-            not self.case_sensitive
-            and isinstance(key, Convertible)
-            and isinstance(key.revert(), str)
-        ):
-            check_items.extend(
-                [
-                    key.revert().casefold(),
-                    key.revert().upper(),
-                    key.revert().title(),
-                ]
+    def __setstate__(self, state) -> None:
+        (
+            forward,
+            convertible_map,
+            inverse,
+            normalized_keys,
+            normalized_values,
+            shadowed,
+            shadowed_normalized_keys,
+            shadowed_normalized_values,
+            attributes,
+        ) = state
+        self.__dict__.update(attributes)
+        dict.update(self, forward)
+        self._convertible_map = convertible_map
+        self._inverse = inverse
+        self._normalized_keys = normalized_keys
+        self._normalized_values = normalized_values
+        self._shadowed = shadowed
+        self._shadowed_normalized_keys = shadowed_normalized_keys
+        self._shadowed_normalized_values = shadowed_normalized_values
+        self._bind_views()
+
+    def __reduce__(self):
+        """
+        Pickle through __getstate__, so loading restores the indexes as they are
+        instead of re-inserting, re-freezing and re-hashing every pair.
+        """
+        return copyreg.__newobj__, (type(self),), self.__getstate__()
+
+    def __copy__(self) -> Self:
+        """A shallow copy with its own indexes, sharing keys, values and Convertibles."""
+        copied = copyreg.__newobj__(type(self))
+        (
+            forward,
+            convertible_map,
+            inverse,
+            normalized_keys,
+            normalized_values,
+            shadowed,
+            shadowed_normalized_keys,
+            shadowed_normalized_values,
+            attributes,
+        ) = self.__getstate__()
+        copied.__setstate__(
+            (
+                forward,
+                convertible_map.copy(),
+                inverse.copy(),
+                normalized_keys.copy(),
+                normalized_values.copy(),
+                {cvalue: keys.copy() for cvalue, keys in shadowed.items()},
+                {form: keys.copy() for form, keys in shadowed_normalized_keys.items()},
+                {form: keys.copy() for form, keys in shadowed_normalized_values.items()},
+                attributes,
             )
+        )
+        return copied
+
+    def __deepcopy__(self, memo: dict) -> Self:
+        copied = copyreg.__newobj__(type(self))
+        memo[id(self)] = copied
+        copied.__setstate__(deepcopy(self.__getstate__(), memo))
+        return copied
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pairs: Iterable[tuple[Any, Any]],
+        size_hint: int | None = None,
+        workers: int | None = None,
+        **kwds,
+    ) -> Self:
+        """
+        Build a ReverseMap from an iterable of (key, value) pairs in one streaming pass.
+
+        Args:
+            pairs: Iterable of (key, value) pairs, consumed once.
+            size_hint: Expected number of pairs, used to size the load batches.
+            workers: Number of processes that freeze and hash non-scalar values.
+                Pays off for large nested values on multi-core machines. Defaults to None,
+                which freezes in this process.
+            **kwds: Options such as ``_verbose``, as accepted by the constructor.
+        """
+        rd = cls(**kwds)
+        if workers:
+            rd._load_parallel(pairs, workers)
+        else:
+            rd._load(pairs, size_hint)
+        return rd
 
-        def check_mappings(key):
-            nonlocal item, loc
-            if self._verbose:
-                show(
-                    f"Checking mappings for key: {key!r} (case_sensitive={self.case_sensitive})"
-                )
-            if item := self._convertible_map.get(key):
-                loc = (
-                    "convertible_map"
-                    if not self.case_sensitive
-                    else "convertible_map (case-sensitive)"
-                )
-            elif item := self.get(key):
-                loc = (
-                    "instance"
-                    if not self.case_sensitive
-                    else "instance (case-sensitive)"
-                )
-            elif item := self._inverse.get(key):
-                loc = (
-                    "inverse" if not self.case_sensitive else "inverse (case-sensitive)"
-                )
-            elif item := self._map.get(key):
-                loc = "map" if not self.case_sensitive else "map (case-sensitive)"
-            elif item := self._inverse_values[key]:
-                loc = (
-                    "inverse_values"
-                    if not self.case_sensitive
-                    else "inverse_values (case-sensitive)"
-                )
-            elif item := self._inverse_items[key]:
-                loc = (
-                    "inverse_items"
-                    if not self.case_sensitive
-                    else "inverse_items (case-sensitive)"
-                )
-            elif item := self._inverse_keys[key]:
-                loc = (
-                    "inverse_keys"
-                    if not self.case_sensitive
-                    else "inverse_keys (case-sensitive)"
+    def _load_parallel(self, pairs: Iterable[tuple[Any, Any]], workers: int) -> Self:
+        """
+        Insert pairs, hashing their non-scalar values in a process pool.
+        Values go to the workers and only their hashes come back; the parent keeps its
+        originals and freezes one only when a lookup has to compare it. At most two
+        chunks per worker are in flight, which bounds the memory held by pending chunks.
+        The pool forks where the platform allows it. Elsewhere one worker's hash probe is
+        compared up front, and when its hash seed or freezers differ the pairs are loaded
+        in this process instead, since the workers' hashes would be discarded anyway.
+        """
+        import multiprocessing
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        pending: deque[tuple[list[tuple[Any, Any]], Future | None]] = deque()
+        probe = _hash_probe()
+        pairs = iter(pairs)
+        forks = 'fork' in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if forks else 'spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            if not forks and pool.submit(_hash_probe).result() != probe:
+                return self._load(pairs)
+            while chunk := list(islice(pairs, _PARALLEL_CHUNK)):
+                values = [value for _, value in chunk if not _freezes_locally(value)]
+                pending.append((chunk, pool.submit(_hash_values, values) if values else None))
+                if len(pending) >= 2 * workers:
+                    self._merge_hashed(*pending.popleft(), probe)
+            while pending:
+                self._merge_hashed(*pending.popleft(), probe)
+        return self
+
+    def _merge_hashed(
+        self, chunk: list[tuple[Any, Any]], future: Future | None, probe: tuple
+    ) -> None:
+        """
+        Insert a chunk with the hashes a worker computed for its non-scalar values,
+        or hash them here when the worker's probe differs from this process's.
+        """
+        worker_probe, hashes = future.result() if future is not None else (None, [])
+        if worker_probe != probe:
+            hashes = [None] * len(hashes)
+        hashes = iter(hashes)
+        wrapped = []
+        for key, value in chunk:
+            if _freezes_locally(value):
+                wrapped.append((key, convertible(value)))
+            else:
+                wrapped.append((key, Convertible._from_frozen(value, cached_hash=next(hashes))))
+        self._load_frozen(wrapped)
+
+    def _load(
+        self, pairs: Iterable[tuple[Any, Any]], size_hint: int | None = None
+    ) -> Self:
+        """
+        Insert pairs, freezing each value once and filling the forward map,
+        inverse and convertible map in a single pass.
+        Forward writes are flushed per batch through ``dict.update``. A pair that is
+        rejected stops the load with the pairs before it written on both sides.
+        """
+        index = self._index
+        batch_size = min(size_hint, _LOAD_BATCH) if size_hint else _LOAD_BATCH
+        pairs = iter(pairs)
+        while batch := list(islice(pairs, max(batch_size, 1))):
+            for position, (key, value) in enumerate(batch):
+                try:
+                    index(key, value)
+                except BaseException:
+                    dict.update(self, batch[:position])
+                    raise
+            dict.update(self, batch)
+        return self
+
+    def _index(self, key, value) -> None:
+        """
+        Update the reverse indexes in place for one pair; the caller writes the forward map.
+        The views and the ChainMap hold live references to the indexes, so no rebuild is needed.
+
+        Raises:
+            TypeError: If key is unhashable, before any index is touched.
+            ValueError: If value contains itself, before any index is touched.
+        """
+        # The forward write hashes key only after the indexes are updated, and a
+        # Convertible hashes even an unhashable key, so check both sides up front
+        hash(key)
+        ckey = key if isinstance(key, Convertible) else convertible(key)
+        cvalue = value if isinstance(value, Convertible) else convertible(value)
+        hash(cvalue)
+        if (stats := self._stats) is not None:
+            stats.freeze(cvalue)
+        if (previous := self._convertible_map.get(ckey)) is not None:
+            # Drop the stale reverse entries of the value being replaced
+            self._unindex_value(key, previous)
+        _claim(self._inverse, self._shadowed, cvalue, key)
+        self._convertible_map[ckey] = cvalue
+        if (normalize := self._normalizer) is not None:
+            # Like the exact indexes, a normalized form resolves to its latest key
+            if previous is None and isinstance(original := _original(key), str):
+                _claim(
+                    self._normalized_keys, self._shadowed_normalized_keys, normalize(original), key
                 )
-            elif item := super().__getitem__(key):
-                loc = (
-                    "instance"
-                    if not self.case_sensitive
-                    else "instance (case-sensitive)"
+            if isinstance(original := cvalue._original, str):
+                _claim(
+                    self._normalized_values,
+                    self._shadowed_normalized_values,
+                    normalize(original),
+                    key,
                 )
-            return item, loc
 
+    def _unindex_value(self, key, cvalue: Convertible) -> None:
+        """
+        Remove the reverse entries that map cvalue back to key. When other keys share
+        cvalue or its normalized form, it falls back to the latest of them.
+        """
+        _release(self._inverse, self._shadowed, cvalue, key)
+        if self._normalizer is not None and isinstance(cvalue._original, str):
+            _release(
+                self._normalized_values,
+                self._shadowed_normalized_values,
+                self._normalizer(cvalue._original),
+                key,
+            )
+
+    def set_normalizer(
+        self, normalizer: str | Normalizer | Iterable[str | Normalizer] | None
+    ) -> Self:
+        """
+        Replace the normalizer and rebuild the normalized shadow index in one pass.
+        Passing None makes lookups exact again.
+        """
+        self._normalizer = get_normalizer(normalizer) if normalizer else None
+        self._normalized_keys.clear()
+        self._normalized_values.clear()
+        self._shadowed_normalized_keys.clear()
+        self._shadowed_normalized_values.clear()
+        if (normalize := self._normalizer) is not None:
+            for key, value in dict.items(self):
+                if isinstance(original := _original(key), str):
+                    _claim(
+                        self._normalized_keys,
+                        self._shadowed_normalized_keys,
+                        normalize(original),
+                        key,
+                    )
+                if isinstance(original := _original(value), str):
+                    _claim(
+                        self._normalized_values,
+                        self._shadowed_normalized_values,
+                        normalize(original),
+                        key,
+                    )
+        return self
+
+    def update(self, *args, **kwds) -> None:
+        """
+        Update the ReverseMap from a mapping or iterable of pairs, keeping the reverse indexes in sync.
+        """
+        self._load(_iter_pairs(args, kwds))
+
+    @classmethod
+    async def aload(
+        cls,
+        pairs: AsyncIterable[tuple[Any, Any]] | Iterable[tuple[Any, Any]],
+        chunk_size: int = 1024,
+        executor: Executor | None = None,
+        **kwds,
+    ) -> Self:
+        """
+        Build a ReverseMap from an async iterable of pairs without blocking the event loop.
+        See aupdate for chunk_size and executor; kwds are constructor options.
+        """
+        rd = cls(**kwds)
+        await rd.aupdate(pairs, chunk_size=chunk_size, executor=executor)
+        return rd
+
+    async def aupdate(
+        self,
+        pairs: AsyncIterable[tuple[Any, Any]] | Iterable[tuple[Any, Any]] | Mapping,
+        chunk_size: int = 1024,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Insert pairs from an async or plain iterable in chunks of chunk_size,
+        yielding to the event loop after each chunk.
+
+        With an executor, values are frozen and hashed there while the next chunk
+        is read, and only the index updates run on the loop. A process pool returns
+        copies of the values, which are stored in place of the originals.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        pending = None
+        async for chunk in _achunks(pairs, max(chunk_size, 1)):
+            if executor is None:
+                self._load(chunk, chunk_size)
+            else:
+                if pending is not None:
+                    self._load_frozen(await pending)
+                pending = loop.run_in_executor(executor, _freeze_chunk, chunk)
+            await asyncio.sleep(0)
+        if pending is not None:
+            self._load_frozen(await pending)
+
+    def _load_frozen(self, frozen: Iterable[tuple[Any, Convertible]]) -> None:
+        """Insert pairs whose values are already wrapped and hashed."""
+        index = self._index
+        batch = []
         try:
-            for item in check_items:
-                item, loc = check_mappings(item)
-                if item:
-                    break
-            if item is None:
-                raise ReverseMappingError(f"Key {key} not found in ReverseMap.")
-        except ReverseMappingError as e:
-            show(f"Error: {e}", color="red", term=True)
-            raise e
-        except TypeError as e:
-            show(f"TypeError: {e} - Key: {key!r}", color="red", term=True)
-            raise TypeError(f"Key {key} is not hashable or convertible.") from e
-        except ValueError as e:
-            show(f"ValueError: {e} - Key: {key!r}", color="red", term=True)
-            raise ValueError(f"Key {key} not found in ReverseMap.") from e
-        except KeyError as e:
-            show(f"KeyError: {e} - Key: {key!r}", color="red", term=True)
-            # If the key is not found, raise a KeyError with a custom message
-            raise KeyError(f"Key {key} not found in ReverseMap.") from e
+            for key, cvalue in frozen:
+                index(key, cvalue)
+                batch.append((key, cvalue._original))
+        finally:
+            # A rejected pair leaves the ones indexed before it written on both sides
+            dict.update(self, batch)
+
+    def setdefault(self, key, default=None):
+        """
+        Return the value for key, inserting default through the indexes if key is missing.
+        """
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        self[key] = default
+        return default
 
+    def __ior__(self, other) -> Self:
+        self.update(other)
+        return self
+
+    def __or__(self, other) -> Self:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return type(self).from_pairs(
+            chain(dict.items(self), other.items()),
+            size_hint=len(self) + len(other),
+            **self._options(),
+        )
+
+    def _options(self) -> dict[str, Any]:
+        """The constructor options of this map, for maps built from it."""
+        return {
+            '_case_sensitive': self.case_sensitive,
+            '_normalizer': self._normalizer,
+            '_verbose': self._verbose,
+        }
+
+    def __setitem__(self, key, value):
+        """
+        Insert a pair and update the reverse indexes in place.
+        """
+        self._index(key, value)
+        super().__setitem__(key, value)
+
+    def _resolve(self, key, default=None):
+        """
+        Resolve key against the forward side, then the reverse side.
+        Scalars and other hashable keys probe the forward map directly, and everything
+        that misses is wrapped once, so an exact lookup costs at most four hash probes. With a normalizer, a string
+        that misses exactly costs one more probe per side in the normalized shadow index.
+        With stats enabled, the tier that resolved key is counted.
+        """
+        stats = self._stats
+        start = perf_counter_ns() if stats is not None else 0
+        original = key._original if isinstance(key, Convertible) else key
+        if type(original) in _SCALARS:
+            if (item := dict.get(self, original, _MISSING)) is not _MISSING:
+                if stats is not None:
+                    stats.record('instance', start)
+                return item
+            ckey = original
         else:
-            if item and self._verbose and loc:
-                print(
-                    f"item found in: {str(loc).title()} | ",
-                    "Item:",
-                    item,
-                    "From Key:",
-                    key,
-                )
+            if type(original).__hash__ is not None:
+                # A hashable key is probed as is first: its frozen form can differ from
+                # that of an equal key, as for frozensets or objects with value-based hashes
+                try:
+                    if (item := dict.get(self, original, _MISSING)) is not _MISSING:
+                        if stats is not None:
+                            stats.record('instance', start)
+                        return item
+                    if (item := self._inverse.get(original, _MISSING)) is not _MISSING:
+                        if stats is not None:
+                            stats.record('inverse', start)
+                        return _original(item)
+                except TypeError:
+                    pass
+            ckey = key if isinstance(key, Convertible) else Convertible(key)
+            if stats is not None:
+                stats.freeze(ckey)
+            if (item := self._convertible_map.get(ckey, _MISSING)) is not _MISSING:
+                if stats is not None:
+                    stats.record('convertible_map', start)
+                return item.revert()
+        if (item := self._inverse.get(ckey, _MISSING)) is not _MISSING:
+            if stats is not None:
+                stats.record('inverse', start)
             return item.revert() if isinstance(item, Convertible) else item
+        if self._normalizer is not None and isinstance(original, str):
+            normalized = self._normalizer(original)
+            if (item := self._normalized_keys.get(normalized, _MISSING)) is not _MISSING:
+                if stats is not None:
+                    stats.record('normalized_keys', start)
+                return dict.__getitem__(self, item)
+            if (item := self._normalized_values.get(normalized, _MISSING)) is not _MISSING:
+                if stats is not None:
+                    stats.record('normalized_values', start)
+                return _original(item)
+        if stats is not None:
+            stats.record(None, start)
+        return default
+
+    def enable_stats(
+        self, callback: Callable[[str | None, int], Any] | None = None
+    ) -> LookupStats:
+        """
+        Start counting lookups per resolving tier, freeze time and latency.
+        Returns the active counters; see LookupStats for callback.
+        """
+        self._stats = LookupStats(callback)
+        return self._stats
 
-    def _sync(self) -> Self:
-        """Sync the internal state of the ReverseMap."""
-        caller = self._caller
-        if caller and caller != "inverse":
-            self.inverse = {
-                convertible(v): k
-                for k, v in self.items()
-                if not isinstance(v, Convertible)
-            }
-            if self._verbose:
-                print("Inverse Mapping:", self.inverse)
-        if caller and caller != "inverse-keys":
-            self.inverse_keys = self._inverse_keys(self.inverse)
-            if self._verbose:
-                print("Inverse Keys: ", self.inverse_keys)
-        if caller and caller != "inverse-values":
-            self.inverse_values = self._inverse_values(self.inverse)
-            if self._verbose:
-                print("Inverse Values: ", self._inverse_values)
-        if caller and caller != "inverse-items":
-            self.inverse_items = self._inverse_items(self.inverse)
-            if self._verbose:
-                print("Inverse Items: ", self._inverse_items)
-        if caller and caller != "convertible-map":
-            self.convertible_map = OrderedDict(
-                {convertible(v): k for k, v in self.inverse_items}
-            )
-            if self._verbose:
-                print("Convertible Mapping:", self._convertible_map)
-        if caller and caller != "map":
-            self.map = ChainMap(self, self.convertible_map, self.inverse)
+    def disable_stats(self) -> None:
+        """Stop counting lookups and drop the counters."""
+        self.__dict__.pop('_stats', None)
+
+    def stats(self) -> dict[str, Any] | None:
+        """Return the lookup counters, or None when stats are disabled."""
+        return None if self._stats is None else self._stats.info()
+
+    def __getitem__(self, key):
+        item = self._resolve(key, _MISSING)
+        if item is _MISSING:
             if self._verbose:
-                print("Combined Mapping:", self.map)
-        self._caller = None
-        return self
+                show(f"KeyError: Key {key!r} not found in ReverseMap.", color="red", term=True)
+            raise KeyError(f"Key {key} not found in ReverseMap.")
+        if self._verbose:
+            print("Item:", item, "From Key:", key)
+        return item
+
+    def get(self, key, default=None):
+        """
+        Return the value of a key or the key of a value, or default.
+        A miss costs the same hash probes as a hit and never logs, formats or raises.
+        """
+        return self._resolve(key, default)
+
+    def lookup(self, key, default=MISSING):
+        """
+        Resolve a key or a value like get, returning MISSING for a miss by default,
+        so a stored None can be told apart from no match.
+        """
+        return self._resolve(key, default)
 
     def __setattr__(self, name, value):
         """Set an attribute on the ReverseMap."""
@@ -466,69 +1009,134 @@ class ReverseMap(dict, Reversible):
             self.__dict__[name] = value
 
     def __delitem__(self, key):
-        super().__delitem__(convertible(key))
-        if convertible(key) in self:
-            del self[convertible(key)]
-        elif key in self:
-            del self[key]
-        self._sync()
+        """
+        Remove the pair of key, or of the value key when it is not a key,
+        from the forward map and every reverse index in place.
+        """
+        self._unlink(self._owner(key)[0])
 
-    def __contains__(self, key) -> bool:
-        check_items = [
-            key.revert() if isinstance(key, Convertible) else key,
-            convertible(key) if not isinstance(key, Convertible) else key,
-        ]
-        if not self.case_sensitive and isinstance(key, str):
-            # Check for case-insensitive keys
-            check_items.extend(
-                [
-                    key.casefold(),
-                    key.upper(),
-                    key.title(),
-                ]
-            )
-        if (
-            not self.case_sensitive
-            and isinstance(key, Convertible)
-            and isinstance(key.revert(), str)
+    def _owner(self, key) -> tuple[Any, bool]:
+        """
+        Return the stored forward key of a key or value,
+        and whether it was found on the forward side.
+
+        Raises:
+            KeyError: If key is neither a key nor a value.
+        """
+        original = _original(key)
+        try:
+            if dict.__contains__(self, original):
+                return original, True
+        except TypeError:
+            original = convertible(key)
+            if dict.__contains__(self, original):
+                return original, True
+        ckey = key if isinstance(key, Convertible) else convertible(key)
+        if (owner := self._inverse.get(ckey, _MISSING)) is not _MISSING:
+            return owner, False
+        raise KeyError(f"Key {key} not found in ReverseMap.")
+
+    def _unlink(self, key):
+        """Remove a forward key and its reverse entries, returning its value."""
+        value = dict.pop(self, key)
+        self._unindex(key, value)
+        return value
+
+    def _unlink_inverse(self, key):
+        """
+        Remove the pair of key looked up as a value first, as InvertedReverseMap sees it,
+        returning the forward key. Finding and removing the pair is one write, so
+        subclasses that lock writes cover both.
+        """
+        ckey = key if isinstance(key, Convertible) else convertible(key)
+        if (owner := self._inverse.get(ckey, _MISSING)) is _MISSING:
+            owner = self._owner(key)[0]
+        self._unlink(owner)
+        return owner
+
+    def _unindex(self, key, value) -> None:
+        """Remove the reverse entries of a pair already gone from the forward map."""
+        ckey = key if isinstance(key, Convertible) else convertible(key)
+        cvalue = self._convertible_map.pop(ckey, None)
+        self._unindex_value(key, cvalue if cvalue is not None else convertible(value))
+        if (normalize := self._normalizer) is not None and isinstance(
+            original := _original(key), str
         ):
-            check_items.extend(
-                [
-                    key.revert().casefold(),
-                    key.revert().upper(),
-                    key.revert().title(),
-                ]
+            _release(
+                self._normalized_keys, self._shadowed_normalized_keys, normalize(original), key
             )
-        ck = convertible(key) if not isinstance(key, Convertible) else key
-        key = key.revert() if isinstance(key, Convertible) else key
-        if inside := super().__contains__(ck) or super().__contains__(key):
-            if self._verbose:
-                show(f"Key {key} found in ReverseMap.")
-            return inside
 
-        def check_key(case_key):
-            if (
-                inside := case_key in self._convertible_map
-                or case_key in self._inverse
-                or case_key in self._inverse_keys
-                or case_key in self._inverse_values
-                or case_key in self._inverse_items
-                or case_key in self.__dict__
-            ):
-                if self._verbose:
-                    show(f"Key {case_key} found in ReverseMap (case-insensitive).")
-                return inside
-            return False
+    def pop(self, key, default=_MISSING):
+        """
+        Remove the pair of key, or of the value key, and return its counterpart.
+        Returns default when given and key is missing.
+        """
+        try:
+            owner, forward = self._owner(key)
+        except KeyError:
+            if default is _MISSING:
+                raise
+            return default
+        value = self._unlink(owner)
+        return value if forward else _original(owner)
+
+    def popitem(self) -> tuple[Any, Any]:
+        """Remove and return the last inserted pair."""
+        key, value = dict.popitem(self)
+        self._unindex(key, value)
+        return key, value
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._inverse.clear()
+        self._convertible_map.clear()
+        self._shadowed.clear()
+        self._normalized_keys.clear()
+        self._normalized_values.clear()
+        self._shadowed_normalized_keys.clear()
+        self._shadowed_normalized_values.clear()
 
-        for case_key in check_items:
-            if inside := check_key(case_key):
-                return inside
+    def __contains__(self, key) -> bool:
+        if self._resolve(key, _MISSING) is not _MISSING:
+            if self._verbose:
+                show(f"Key {key} found in ReverseMap.")
+            return True
         if self._verbose:
             show(f"Key {key} not found in ReverseMap.")
         return False
 
-    def __iter__(self) -> Generator[Any, Any, None]:
-        yield from list(self.keys()) + list(self._inverse_keys)
+    def get_many(self, keys: Iterable, default=None) -> list[Any]:
+        """
+        Resolve a batch of keys or values in one call, with default for each miss.
+        Scalars are probed through bound lookups instead of the per-item __getitem__
+        cascade; anything else falls back to the full resolution, as does every key
+        while stats are enabled, so each one is counted.
+        """
+        if self._stats is not None:
+            resolve = self._resolve
+            return [resolve(key, default) for key in keys]
+        forward = super().get
+        inverse = self._inverse.get
+        resolve = self._resolve
+        exact = self._normalizer is None
+        results = []
+        append = results.append
+        for key in keys:
+            if type(key) in _SCALARS:
+                if (item := forward(key, _MISSING)) is not _MISSING:
+                    append(item)
+                    continue
+                if (item := inverse(key, _MISSING)) is not _MISSING:
+                    append(item._original if isinstance(item, Convertible) else item)
+                    continue
+                if exact:
+                    append(default)
+                    continue
+            append(resolve(key, default))
+        return results
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain(dict.__iter__(self), self._inverse_keys)
 
     def __len__(self) -> int:
         return len(self.keys())
@@ -545,9 +1153,7 @@ class ReverseMap(dict, Reversible):
         """
         Sets the combined mapping of the ReverseMap.
         """
-        self._caller = "map"
         self._map = ChainMap(self, value, self._convertible_map, self._inverse)
-        self._sync()
 
     @property
     def inverse(self) -> ReverseMap:
@@ -558,20 +1164,35 @@ class ReverseMap(dict, Reversible):
 
     @inverse.setter
     def inverse(self, value: Mapping):
-        self._caller = "inverse"
-        self._inverse = ReverseMap(**value)
-        self._sync()
+        """
+        Replaces the contents of the inverse dictionary, keeping the views bound to it.
+        """
+        self._inverse.clear()
+        self._shadowed.clear()
+        self._inverse.update((convertible(k), v) for k, v in value.items())
+
+    def invert(self, copy: bool = False) -> InvertedReverseMap | ReverseMap:
+        """
+        Return the ReverseMap with keys/values swapped.
 
-    def invert(self) -> ReverseMap:
+        Args:
+            copy: Materialize a new ReverseMap instead of returning a view
+                that shares this map's storage. Defaults to False.
         """
-        Return a new ReverseMap with keys/values swapped
+        if not copy:
+            return InvertedReverseMap(self)
+        return ReverseMap.from_pairs(
+            ((_storable(value), key) for value, key in self._inverse.items()),
+            size_hint=len(self._inverse),
+            **self._options(),
+        )
+
+    @property
+    def inverted(self) -> InvertedReverseMap:
         """
-        inv = ReverseMap()
-        for k, v in self.items():
-            inv[convertible(v) if not isinstance(v, Convertible) else v] = (
-                k.revert() if isinstance(v, Convertible) else k
-            )
-        return inv
+        A view of the ReverseMap with keys/values swapped, sharing its storage.
+        """
+        return InvertedReverseMap(self)
 
     @property
     def inverse_keys(self) -> ReverseMapKeys:
@@ -585,9 +1206,7 @@ class ReverseMap(dict, Reversible):
         """
         Sets the keys of the inverse dictionary.
         """
-        self._caller = "inverse-keys"
         self._inverse_keys = value
-        self._sync()
 
     @property
     def inverse_values(self) -> ReverseMapValues:
@@ -601,9 +1220,7 @@ class ReverseMap(dict, Reversible):
         """
         Sets the values of the inverse dictionary.
         """
-        self._caller = "inverse-values"
         self._inverse_values = value
-        self._sync()
 
     @property
     def inverse_items(self) -> ReverseMapItems:
@@ -617,9 +1234,7 @@ class ReverseMap(dict, Reversible):
         """
         Sets the items of the inverse dictionary.
         """
-        self._caller = "inverse-items"
         self._inverse_items = value
-        self._sync()
 
     @property
     def convertible_map(self) -> ReverseMap:
@@ -631,11 +1246,12 @@ class ReverseMap(dict, Reversible):
     @convertible_map.setter
     def convertible_map(self, value: Mapping):
         """
-        Sets the convertible dictionary.
+        Replaces the contents of the convertible dictionary in place.
         """
-        self._caller = "convertible-map"
-        self._convertible_map = ReverseMap(**value)
-        self._sync()
+        self._convertible_map.clear()
+        self._convertible_map.update(
+            (convertible(k), convertible(v)) for k, v in value.items()
+        )
 
     def __reversed__(self) -> Iterator[ReverseMapKeys]:
         """
@@ -650,4 +1266,117 @@ class ReverseMap(dict, Reversible):
         return f"ReverseMap({super().__repr__()})"
 
 
+class InvertedReverseMap(MutableMapping):
+    """
+    A view of a ReverseMap with the roles of keys and values swapped.
+    It shares the ReverseMap's indexes, so creating it is O(1) and writes go through.
+    """
+
+    __slots__ = ('_reverse_map',)
+
+    def __init__(self, reverse_map: ReverseMap):
+        self._reverse_map = reverse_map
+
+    def _resolve(self, key, default=None):
+        """Resolve key against the values of the ReverseMap first, then its keys."""
+        stats = self._reverse_map._stats
+        start = perf_counter_ns() if stats is not None else 0
+        original = _original(key)
+        if type(original) in _SCALARS:
+            ckey = original
+        else:
+            ckey = key if isinstance(key, Convertible) else Convertible(key)
+        if (item := self._reverse_map._inverse.get(ckey, _MISSING)) is not _MISSING:
+            if stats is not None:
+                stats.record('inverse', start)
+            return _original(item)
+        return self._reverse_map._resolve(key, default)
+
+    def __getitem__(self, key):
+        if (item := self._resolve(key, _MISSING)) is _MISSING:
+            raise KeyError(f"Key {key} not found in InvertedReverseMap.")
+        return item
+
+    def get(self, key, default=None):
+        return self._resolve(key, default)
+
+    def lookup(self, key, default=MISSING):
+        """Resolve a value of the ReverseMap to its key, or a key to its value, or MISSING."""
+        return self._resolve(key, default)
+
+    def get_many(self, keys: Iterable, default=None) -> list[Any]:
+        """
+        Resolve a batch of values of the ReverseMap to their keys in one call,
+        falling back to its keys, with default for each miss.
+        """
+        if self._reverse_map._stats is not None:
+            resolve = self._resolve
+            return [resolve(key, default) for key in keys]
+        inverse = self._reverse_map._inverse.get
+        resolve = self._reverse_map._resolve
+        results = []
+        append = results.append
+        for key in keys:
+            if type(key) in _SCALARS:
+                if (item := inverse(key, _MISSING)) is not _MISSING:
+                    append(item._original if isinstance(item, Convertible) else item)
+                    continue
+                append(resolve(key, default))
+            else:
+                append(self._resolve(key, default))
+        return results
+
+    def __setitem__(self, key, value):
+        self._reverse_map[value] = key
+
+    def __delitem__(self, key):
+        self._reverse_map._unlink_inverse(key)
+
+    def __contains__(self, key) -> bool:
+        return self._resolve(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._reverse_map._inverse_keys)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._reverse_map._inverse_keys)
+
+    def __len__(self) -> int:
+        return len(self._reverse_map._inverse)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Mapping) or len(self) != len(other):
+            return False
+        return all(
+            _probe(other, key) == _original(value)
+            for key, value in self._reverse_map._inverse.items()
+        )
+
+    @property
+    def inverse(self) -> ReverseMap:
+        """
+        The ReverseMap this view inverts.
+        """
+        return self._reverse_map
+
+    def invert(self, copy: bool = False) -> ReverseMap:
+        """
+        Return the ReverseMap this view inverts, or a copy of it.
+        """
+        if not copy:
+            return self._reverse_map
+        return ReverseMap.from_pairs(
+            dict.items(self._reverse_map),
+            size_hint=len(self._reverse_map),
+            **self._reverse_map._options(),
+        )
+
+    def __repr__(self) -> str:
+        pairs = ', '.join(
+            f"{_original(value)!r}: {key!r}"
+            for value, key in self._reverse_map._inverse.items()
+        )
+        return f"InvertedReverseMap({{{pairs}}})"
+
+
 type ReverseMapping = ReverseMap
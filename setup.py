@@ -8,7 +8,7 @@ setuptools.setup(
     author_email="sk@perfectatrifecta.com",
     description="ReverseMap is a specialized Python dictionary that enables bidirectional lookups - you can search using either keys or values with the in operator. It handles non-hashable objects by automatically converting them to hashable representations while maintaining the ability to revert back to the original objects.",
     download_url="https://github.com/RI7TE/ReverseMap.git",
-    py_modules=["convert", "rdict", "reverse", "test"],
+    py_modules=["compact", "convert", "mapped", "multi", "normalize", "rdict", "reverse", "shared", "test", "threadsafe"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -21,5 +21,5 @@ setuptools.setup(
         "Programming Language :: Python :: 3.13",
     ],
     python_requires=">=3.10",
-    install_requires=["colorama==0.4.6"],
+    extras_require={"color": ["colorama==0.4.6"]},
 )
@@ -0,0 +1,242 @@
+from __future__ import annotations
+import struct
+import threading
+import time
+
+from collections.abc import Iterable, Iterator, Mapping
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Self
+
+from ReverseMap.mapped import MappedReverseMap, _compile
+
+
+_CONTROL_MAGIC = b'RVSHM\x00\x01\x00'
+# magic, sequence (odd while a version is being published), segment name length, name
+_CONTROL = struct.Struct('<8sQI64s')
+_MISSING = object()
+# Attempts to attach to the current version before giving up on a publisher that
+# keeps naming a segment that no longer exists
+_ATTACH_ATTEMPTS = 8
+_ATTACH_LOCK = threading.Lock()
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attach to an existing segment without handing it to the resource tracker,
+    which would unlink it when this process exits.
+    """
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    # Before 3.13 every attach registers the segment. Unregistering afterwards would also
+    # drop the publisher's registration when both share a tracker, as forked workers do,
+    # so registration is skipped instead, for this thread only: other threads creating
+    # segments meanwhile are still tracked
+    thread = threading.get_ident()
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+
+        def register_others(resource: str, rtype: str) -> None:
+            if rtype != 'shared_memory' or threading.get_ident() != thread:
+                register(resource, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+class _SharedVersion(MappedReverseMap):
+    """One published version, mapped from its shared memory segment."""
+
+    def __init__(self, segment: SharedMemory):
+        self._segment = segment
+        self._data = None
+        try:
+            self._bind(segment.buf, segment.name)
+        except ValueError:
+            segment.close()
+            raise
+
+    def close(self) -> None:
+        if self._data is not None:
+            self._release()
+            self._data = None
+            self._segment.close()
+
+    def __del__(self):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"_SharedVersion({self._segment.name!r}, {self._count} pairs)"
+
+
+class SharedReverseMapPublisher:
+    """
+    Publishes a ReverseMap into shared memory for SharedReverseMap readers.
+
+    Each version is compiled into its own segment, as ``MappedReverseMap.compile``
+    would write it to a file. A small control segment named after the publisher holds
+    the name of the current version under a sequence counter, which ``publish``
+    updates last, so readers switch to a new version atomically. The previous segment
+    is unlinked once replaced; readers still attached to it keep it until they move on.
+
+    Args:
+        name: Name of the control segment that readers attach to.
+        source: Optional map or pairs to publish as the first version.
+    """
+
+    def __init__(self, name: str, source: Mapping | Iterable[tuple[Any, Any]] | None = None):
+        self.name = name
+        self.version = 0
+        self._control = SharedMemory(name, create=True, size=_CONTROL.size)
+        _CONTROL.pack_into(self._control.buf, 0, _CONTROL_MAGIC, 0, 0, b'')
+        self._segment: SharedMemory | None = None
+        if source is not None:
+            self.publish(source)
+
+    def publish(self, source: Mapping | Iterable[tuple[Any, Any]]) -> int:
+        """Compile source into a new segment, swap readers over to it and return its version."""
+        version = self.version + 1
+        if len(encoded := f"{self.name}.{version}".encode()) > 64:
+            raise ValueError(f"Segment name {encoded!r} is longer than 64 bytes.")
+        parts = _compile(source)
+        segment = SharedMemory(encoded.decode(), create=True, size=sum(map(len, parts)))
+        offset = 0
+        for part in parts:
+            segment.buf[offset : offset + len(part)] = part
+            offset += len(part)
+        buf = self._control.buf
+        struct.pack_into('<Q', buf, 8, 2 * version - 1)
+        struct.pack_into('<I64s', buf, 16, len(encoded), encoded)
+        struct.pack_into('<Q', buf, 8, 2 * version)
+        previous, self._segment, self.version = self._segment, segment, version
+        if previous is not None:
+            previous.close()
+            previous.unlink()
+        return version
+
+    def close(self) -> None:
+        """Unlink the current version and the control segment; attached readers keep working."""
+        for segment in (self._segment, self._control):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self._segment = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedReverseMapPublisher({self.name!r}, version {self.version})"
+
+
+class SharedReverseMap(Mapping):
+    """
+    A read-only replica of a ReverseMap published by SharedReverseMapPublisher.
+
+    Lookups run against the shared segment of the current version, so attaching
+    neither copies nor unpickles the map, and hashes are computed from the canonical
+    encoding of ``MappedReverseMap``, so they do not depend on PYTHONHASHSEED. Each
+    lookup checks the control segment and moves to a newer version when one is
+    published. Iteration stays on the version it started with.
+
+    Args:
+        name: Name the publisher was created with.
+
+    Raises:
+        FileNotFoundError: If no publisher with that name exists, or its current
+            version is gone because the publisher closed.
+        ValueError: If the segment is not a published ReverseMap.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._control = _attach(name)
+        if bytes(self._control.buf[:8]) != _CONTROL_MAGIC:
+            self._control.close()
+            raise ValueError(f"{name} is not a published ReverseMap.")
+        self._sequence = 0
+        self._current: _SharedVersion | None = None
+        self._refresh()
+
+    def _refresh(self) -> _SharedVersion:
+        """Return the current version, attaching to a newer one if it was published."""
+        buf = self._control.buf
+        attempts = 0
+        while True:
+            _, sequence, length, name = _CONTROL.unpack_from(buf)
+            if sequence == self._sequence and self._current is not None:
+                return self._current
+            if sequence == 0:
+                raise LookupError(f"Nothing has been published to {self.name} yet.")
+            if sequence & 1 or _CONTROL.unpack_from(buf)[1] != sequence:
+                time.sleep(0)
+                continue
+            try:
+                segment = _attach(name[:length].decode())
+            except FileNotFoundError:
+                # Usually replaced and unlinked between reading its name and attaching;
+                # a publisher that closed leaves a name that never comes back
+                attempts += 1
+                if attempts >= _ATTACH_ATTEMPTS:
+                    raise FileNotFoundError(
+                        f"The current version of {self.name} no longer exists; "
+                        "its publisher may have closed."
+                    ) from None
+                time.sleep(0)
+                continue
+            self._current, self._sequence = _SharedVersion(segment), sequence
+            return self._current
+
+    @property
+    def version(self) -> int:
+        """The version currently attached, refreshed first."""
+        self._refresh()
+        return self._sequence // 2
+
+    def __getitem__(self, key):
+        if (item := self._refresh()._resolve(key, _MISSING)) is _MISSING:
+            raise KeyError(f"Key {key} not found in SharedReverseMap.")
+        return item
+
+    def get(self, key, default=None):
+        return self._refresh()._resolve(key, default)
+
+    def get_many(self, keys: Iterable, default=None) -> list[Any]:
+        """Resolve a batch of keys or values against one version, with default for each miss."""
+        return self._refresh().get_many(keys, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self._refresh()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._refresh())
+
+    def __len__(self) -> int:
+        return len(self._refresh())
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        return self._refresh().items()
+
+    def close(self) -> None:
+        """Detach from the control segment and the current version."""
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+        self._control.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SharedReverseMap({self.name!r}, version {self._sequence // 2})"
@@ -1,8 +1,29 @@
-from _util import show
-from convert import Convertible, convertible
+import asyncio
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from concurrent.futures import ThreadPoolExecutor
+
 from icecream import ic
-from rdict import rdict
-from reverse import ReverseDictItems, ReverseDictKeys, ReverseDictValues, ReverseMap
+
+from ReverseMap import convert as convert_module
+from ReverseMap import reverse as rd_module
+from ReverseMap._util import show
+from ReverseMap.compact import CompactReverseMap
+from ReverseMap.convert import Convertible, convertible
+from ReverseMap.mapped import MappedReverseMap
+from ReverseMap.multi import ReverseMultiMap
+from ReverseMap.rdict import rdict
+from ReverseMap.reverse import MISSING, ReverseMap, ReverseMapItems, ReverseMapKeys, ReverseMapValues
+from ReverseMap.shared import SharedReverseMap, SharedReverseMapPublisher
+from ReverseMap.threadsafe import ConcurrentReverseMap
 
 
 def test_rdict():
@@ -178,16 +199,16 @@ def test_reverse_dict_items():
     rd['key1'] = 'value1'
     rd['key2'] = 'value2'
 
-    items = ReverseDictItems(rd)
-    show("ReverseDictItems:", list(items))
+    items = ReverseMapItems(rd)
+    show("ReverseMapItems:", list(items))
 
     # Test item retrieval
     for item in items:
         show("Item key:", item.key, "Item value:", item.value)
         inverse = rd._inverse
-        _inverse_keys = ReverseDictKeys(rd)
-        _inverse_values = ReverseDictValues(rd)
-        _inverse_items = ReverseDictItems(rd)
+        _inverse_keys = ReverseMapKeys(rd)
+        _inverse_values = ReverseMapValues(rd)
+        _inverse_items = ReverseMapItems(rd)
         show("Inverse key:", inverse[item.value], "Inverse value:", item.key)
         show("Inverse Keys:", list(_inverse_keys))
         show("Inverse Values:", list(_inverse_values))
@@ -200,8 +221,8 @@ def test_reverse_dict_keys():
     rd['key1'] = 'value1'
     rd['key2'] = 'value2'
 
-    keys = ReverseDictKeys(rd)
-    show("ReverseDictKeys:", list(keys))
+    keys = ReverseMapKeys(rd)
+    show("ReverseMapKeys:", list(keys))
 
     # Test key retrieval
     for key in keys:
@@ -217,8 +238,8 @@ def test_reverse_dict_values():
     rd['key1'] = 'value1'
     rd['key2'] = 'value2'
 
-    values = ReverseDictValues(rd)
-    show("ReverseDictValues:", list(values))
+    values = ReverseMapValues(rd)
+    show("ReverseMapValues:", list(values))
 
     # Test value retrieval
     for value in values:
@@ -325,6 +346,756 @@ def test_chainmap():
     return True, "test_chainmap"
 
 
+def test_setitem_scaling():
+    def fill(size):
+        rd = ReverseMap()
+        start = time.perf_counter()
+        for i in range(size):
+            rd[i] = f"value{i}"
+        return time.perf_counter() - start
+
+    small = fill(5_000)
+    large = fill(40_000)
+    # 8x the entries should cost about 8x the time; quadratic inserts would cost ~64x
+    show("Insert scaling (5k, 40k, ratio):", small, large, large / small)
+    assert large / small < 24, "ReverseMap.__setitem__ no longer scales linearly"
+    return True, "test_setitem_scaling"
+
+
+def test_bulk_load():
+    rd = ReverseMap.from_pairs(((f"key{i}", [i]) for i in range(1_000)), size_hint=1_000)
+    show("Bulk loaded:", len(rd), len(rd._inverse), len(rd._convertible_map))
+    rd.update({'key0': 'replaced'}, extra='value')
+    rd |= [('more', 'pairs')]
+    show("Updated inverse has replaced value:", convertible('replaced') in rd._inverse)
+    show("Stale value dropped:", convertible([0]) not in rd._inverse)
+    merged = rd | {'merged': 'value'}
+    show("Merged type:", type(merged), len(merged))
+    return True, "test_bulk_load"
+
+
+def test_rejected_pairs():
+    rd = ReverseMap({'a': 1})
+    cyclic = [1]
+    cyclic.append(cyclic)
+    for key, value in (([1], 'x'), ('a', cyclic)):
+        try:
+            rd[key] = value
+        except (TypeError, ValueError) as e:
+            show("Rejected pair:", type(e).__name__)  # TypeError, then ValueError
+    show("No ghost entries:", 'x' in rd, rd.get('x'), rd[1], dict(rd))  # False None a {'a': 1}
+    assert 'x' not in rd and rd.get('x') is None and rd[1] == 'a' and dict(rd) == {'a': 1}
+    assert len(rd._inverse) == len(rd._convertible_map) == 1
+    try:
+        rd.update([('b', 2), ('c', 3), ([1], 4), ('d', 5)])
+    except TypeError:
+        pass
+    show("A rejected batch pair keeps the sides in step:", dict(rd), 4 in rd)  # {'a': 1, 'b': 2, 'c': 3} False
+    assert dict(rd) == {'a': 1, 'b': 2, 'c': 3} and rd[3] == 'c' and 4 not in rd
+    assert len(rd._inverse) == len(rd._convertible_map) == 3
+    return True, "test_rejected_pairs"
+
+
+def test_convertible_lazy():
+    key = Convertible([1, 2, {'a': 3}])
+    assert key._frozen is convert_module._UNFROZEN and key._hash is None
+    show("Frozen before hashing:", key._frozen is not key.frozen)
+    assert key._frozen is key.frozen and key._hash is None
+    first = hash(key)
+    show("Hash cached:", key._hash == first == hash(key))
+    assert key._hash == first == hash(key)
+    show("Iterator created lazily:", key._iterobject is None)
+    assert key._iterobject is None
+    show("Equal to a fresh wrapper:", key == Convertible([1, 2, {'a': 3}]))
+    assert key == Convertible([1, 2, {'a': 3}]) and key != Convertible([1, 2, {'a': 4}])
+    return True, "test_convertible_lazy"
+
+
+def test_bidirectional_lookup():
+    rd = ReverseMap({'x': 'apple', 'y': [1, 2], 'z': {'a': [1]}})
+    rd['a'] = 1
+    show("Forward:", rd['x'], rd['a'])  # apple 1
+    assert (rd['x'], rd['a']) == ('apple', 1)
+    show("Reverse:", rd['apple'], rd[1], rd[[1, 2]], rd[{'a': [1]}])  # x a y z
+    assert (rd['apple'], rd[1], rd[[1, 2]], rd[{'a': [1]}]) == ('x', 'a', 'y', 'z')
+    show("Wrapped key:", rd[convertible('x')])  # apple
+    assert rd[convertible('x')] == 'apple'
+
+    class Version:
+        # Equal and hashed by number only, so the label does not change which key it is
+        def __init__(self, number, label):
+            self.number = number
+            self.label = label
+
+        def __eq__(self, other):
+            return isinstance(other, Version) and self.number == other.number
+
+        def __hash__(self):
+            return hash(self.number)
+
+    rd[Version(1, 'first')] = 'v1'
+    rd[frozenset(f"tag{i}" for i in range(8))] = 'tags'
+    equal_version = Version(1, 'relabelled')
+    reordered = frozenset(f"tag{i}" for i in reversed(range(8)))
+    show("Equal hashable keys:", rd.get(equal_version), rd.get(reordered))  # v1 tags
+    assert equal_version in rd and rd[equal_version] == 'v1'
+    assert reordered in rd and rd.get(reordered) == 'tags' and rd.lookup(reordered) == 'tags'
+    try:
+        rd['missing']
+    except KeyError as e:
+        show("Missing key:", e)
+    else:
+        raise AssertionError("a missing key was found")
+    return True, "test_bidirectional_lookup"
+
+
+def test_membership_scaling():
+    def probe(size):
+        rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(size))
+        start = time.perf_counter()
+        for i in range(5_000):
+            -i - 1 in rd  # miss
+            f"value{i}" in rd._inverse_keys
+            i in rd._inverse_values
+        return time.perf_counter() - start
+
+    small = probe(1_000)
+    large = probe(100_000)
+    show("Membership timing (1k, 100k, ratio):", small, large, large / small)
+    assert large / small < 5, "membership checks no longer run in constant time"
+    return True, "test_membership_scaling"
+
+
+def test_live_views():
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(100_000))
+    keys = rd._inverse_keys
+    rd['late'] = 'entry'
+    show("View sees later inserts:", 'entry' in list(reversed(keys))[:1])
+    tracemalloc.start()
+    for _ in rd:
+        pass
+    for _ in rd._inverse_items:
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    show("Peak bytes while iterating 100k entries:", peak)
+    assert peak < 64_000, "iteration copies the map"
+    return True, "test_live_views"
+
+
+def test_normalizer():
+    rd = ReverseMap({'Apple': 'Pie'}, _case_sensitive=False)
+    show("Case-insensitive both ways:", rd['APPLE'], rd['pie'])  # Pie Apple
+    merged = rd | {'Kiwi': 'Tart'}
+    inverted = rd.invert(copy=True)
+    show("Derived maps keep the options:", merged.get('apple'), merged.get('TART'), inverted.get('PIE'))  # Pie Kiwi Apple
+    assert merged.get('apple') == 'Pie' and merged.get('TART') == 'Kiwi' and inverted.get('PIE') == 'Apple'
+    rd.set_normalizer(['nfkc', 'strip', 'casefold'])
+    rd['Cafe'] = ' ＬＡＴＴＥ '
+    show("NFKC and whitespace:", rd['latte'])  # Cafe
+    restored = pickle.loads(pickle.dumps(rd))
+    deep = copy.deepcopy(rd)
+    show("Composed normalizer survives pickling:", restored['latte'], deep['LATTE'])  # Cafe Cafe
+    assert restored._normalizer == rd._normalizer and deep['latte'] == 'Cafe'
+    del rd['Apple']
+    show("Shadow index updated on delete:", 'apple' in rd, 'pie' in rd)  # False False
+    variants = ReverseMap(_case_sensitive=False)
+    variants['Apple'] = 'Pie'
+    variants['APPLE'] = 'PIE'
+    show("Latest variant wins both ways:", variants['apple'], variants['pie'])  # PIE APPLE
+    del variants['APPLE']
+    show("Falls back to the variant left:", variants.get('apple'), variants.get('pie'))  # Pie Apple
+    assert variants.get('apple') == 'Pie' and variants.get('pie') == 'Apple'
+    variants['Banana'] = 'pie'
+    variants['Banana'] = 'tart'
+    del variants['Apple']
+    show("Rebound and deleted variants leave nothing stale:", variants.get('apple'), variants.get('pie'))  # None None
+    assert variants.get('apple') is None and variants.get('pie') is None
+    return True, "test_normalizer"
+
+
+def test_freeze_cache():
+    cache = convert_module.enable_freeze_cache(maxsize=2)
+    try:
+        config = {'a': [1, 2, {'b': 3}]}
+        rd = ReverseMap()
+        rd['x'] = config
+        assert (cache.hits, cache.misses) == (0, 1)
+        show("Reverse lookup of a cached value:", rd[config])  # x
+        assert rd[config] == 'x'
+        assert cache.hits >= 1 and cache.misses == 1
+        show("Freeze cache counters:", convert_module.freeze_cache_info())
+        config['c'] = 4
+        show("Resized object is refrozen:", convertible(config) == convertible(dict(config)))
+        assert convertible(config) == convertible(dict(config))
+        hits, misses = cache.hits, cache.misses
+        host = {'host': 'a', 'port': 80}
+        rd['old'] = host
+        host['host'] = 'b'
+        rd['new'] = host
+        assert (cache.hits, cache.misses) == (hits, misses + 2)
+        show("Rebound member is refrozen:", rd.get(host))  # new
+        assert rd.get(host) == 'new' and cache.hits > hits
+        assert rd.get({'host': 'a', 'port': 80}) == 'old'
+        for i in range(5):
+            convertible([i]).as_key
+        show("Bounded size:", len(cache) <= 2)
+        assert len(cache) <= 2
+    finally:
+        convert_module.disable_freeze_cache()
+    return True, "test_freeze_cache"
+
+
+def test_deep_freeze():
+    def build(depth):
+        payload = [0]
+        for i in range(depth):
+            payload = [i, {'child': payload}]
+        return payload
+
+    payload = build(100_000)
+    key = convertible(payload)
+    show("Deep payload hashes:", isinstance(hash(key), int))
+    rd = ReverseMap()
+    rd['deep'] = payload
+    rebuilt = build(100_000)
+    show("Deep reverse lookup:", rd[rebuilt])  # deep
+    assert rebuilt is not payload and rd[rebuilt] == 'deep' and hash(convertible(rebuilt)) == hash(key)
+    assert rd.get(build(99_999)) is None
+    cyclic = [1]
+    cyclic.append(cyclic)
+    try:
+        hash(convertible(cyclic))
+    except ValueError as e:
+        show("Cyclic payload:", e)
+    else:
+        raise AssertionError("a cyclic payload was hashed")
+    return True, "test_deep_freeze"
+
+
+def test_custom_freezers():
+    import dataclasses
+    import datetime
+    import decimal
+    import enum
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: list
+
+    class Color(enum.Enum):
+        RED = 'red'
+
+    class Account:
+        def __init__(self, number):
+            self.number = number
+
+        def __reversemap_key__(self):
+            return self.number
+
+    pickled = []
+    dumps = convert_module.pickle.dumps
+    convert_module.pickle.dumps = lambda obj, *args, **kwds: pickled.append(obj) or dumps(obj, *args, **kwds)
+    try:
+        rd = ReverseMap(
+            point=Point(1, [2]),
+            color=Color.RED,
+            when=datetime.datetime(2024, 1, 1),
+            amount=decimal.Decimal('1.50'),
+            account=Account(42),
+        )
+        show("Dataclass:", rd[Point(1, [2])])  # point
+        show("Enum:", rd[Color.RED])  # color
+        show("Datetime:", rd[datetime.datetime(2024, 1, 1)])  # when
+        show("Decimal:", rd[decimal.Decimal('1.50')])  # amount
+        show("Protocol:", rd[Account(42)])  # account
+        assert rd[Point(1, [2])] == 'point' and rd[Color.RED] == 'color'
+        assert rd[datetime.datetime(2024, 1, 1)] == 'when'
+        assert rd[decimal.Decimal('1.50')] == 'amount' and rd[Account(42)] == 'account'
+        frozen = [convert_module._freeze(obj) for obj in (Point(1, [2]), Color.RED, Account(42))]
+    finally:
+        convert_module.pickle.dumps = dumps
+    show("Frozen dataclass key:", frozen[0])
+    show("Pickle fallback used:", pickled)  # []
+    assert pickled == [] and not any(isinstance(key, bytes) for key in frozen)
+    return True, "test_custom_freezers"
+
+
+def test_delete_scaling():
+    def drain(size):
+        rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(size))
+        start = time.perf_counter()
+        for i in range(0, 5_000, 2):
+            del rd[i]
+            rd.pop(f"value{i + 1}")
+        return time.perf_counter() - start
+
+    small = drain(10_000)
+    large = drain(100_000)
+    show("Delete timing (10k, 100k, ratio):", small, large, large / small)
+    assert large / small < 5, "deletes no longer run in constant time"
+    rd = ReverseMap({'x': 'apple', 'y': [1, 2]})
+    del rd[[1, 2]]  # by value
+    show("Deleted by value:", 'y' in rd, [1, 2] in rd)  # False False
+    show("popitem:", rd.popitem(), len(rd._inverse), len(rd._convertible_map))  # ('x', 'apple') 0 0
+    return True, "test_delete_scaling"
+
+
+def test_shared_value_delete():
+    rd = ReverseMap()
+    rd['a'] = 1
+    rd['b'] = 1
+    del rd['b']
+    show("Value falls back to the key left:", rd.get(1), 1 in rd)  # a True
+    assert rd.get(1) == 'a' and 1 in rd
+    rd.update(b=1, c=1)
+    del rd['c']
+    rd['b'] = 2
+    show("Latest key left, then the one before:", rd[1], rd[2])  # a b
+    assert rd[1] == 'a' and rd[2] == 'b'
+    shallow = copy.copy(rd)
+    rd['d'] = 1
+    del rd['d']
+    del shallow['a']
+    show("Copies keep their own fallbacks:", rd[1], shallow.get(1))  # a None
+    assert rd[1] == 'a' and shallow.get(1) is None
+    cm = CompactReverseMap()
+    cm[1] = 5
+    cm[2] = 5
+    del cm[2]
+    show("Compact value falls back too:", cm.get(5))  # 1
+    assert cm.get(5) == 1
+    return True, "test_shared_value_delete"
+
+
+def test_invert_view():
+    # bench.py times invert() up to 1M entries; a constant-time check needs less
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(100_000))
+    tracemalloc.start()
+    start = time.perf_counter()
+    inverted = rd.invert()
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    show("Invert 100k entries (seconds, bytes):", elapsed, allocated)
+    assert allocated < 4_096, "invert() copies the map"
+    show("Swapped roles:", inverted['value5'], inverted[5])  # 5 value5
+    rd['late'] = 'entry'
+    show("View is live:", inverted['entry'])  # late
+    show("Round trip:", inverted.invert() is rd)  # True
+    copied = rd.invert(copy=True)
+    show("Materialized copy:", type(copied), copied['entry'])  # ReverseMap late
+    return True, "test_invert_view"
+
+
+def test_compact():
+    cm = CompactReverseMap({1: 'one', 2: 'two'}, value_type=str)
+    show("Compact lookups:", cm[1], cm['two'], 'one' in cm, 3 in cm)  # one 2 True False
+    del cm['one']  # by value
+    cm[3] = 'three'
+    show("Compact items:", list(cm.items()))  # [(2, 'two'), (3, 'three')]
+    size = 100_000
+    pairs = [(i, i + size) for i in range(size)]
+    compact = CompactReverseMap(pairs, size_hint=size)
+    show("Compact bytes per entry:", compact.nbytes / size)
+    assert compact.nbytes / size < 100, "compact storage grew past its budget"
+    assert compact[size + 5] == 5 and compact[5] == size + 5
+    ints = CompactReverseMap({1: 10, 2: 20})
+    strs = CompactReverseMap({1: 'a'}, value_type=str)
+    for target, key, value in ((ints, 2, 2**70), (ints, 3, 2**70), (strs, 1, '\ud800')):
+        try:
+            target[key] = value
+        except (OverflowError, UnicodeEncodeError) as e:
+            show("Rejected value:", type(e).__name__)
+    ints[3] = 30
+    show("Rejected pairs leave the map intact:", list(ints.items()), ints[30], list(strs.items()))
+    assert len(ints) == 3 and list(ints.items()) == [(1, 10), (2, 20), (3, 30)]
+    assert ints[2] == 20 and ints[20] == 2 and ints[30] == 3 and ints.get(2**70) is None
+    assert len(strs) == 1 and strs[1] == 'a' and strs['a'] == 1
+    return True, "test_compact"
+
+
+def test_get_many():
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(100_000))
+    batch = list(range(0, 100_000, 3)) + [f"value{i}" for i in range(1, 100_000, 3)]
+
+    def loop():
+        return [rd[x] for x in batch]
+
+    start = time.perf_counter()
+    looped = loop()
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = rd.get_many(batch)
+    batch_time = time.perf_counter() - start
+    show("get_many against a loop (seconds):", batch_time, loop_time)
+    assert batched == looped and batch_time < loop_time, "get_many lost to a loop"
+    show("Misses:", rd.get_many(['nope', [1, 2]], default=-1))  # [-1, -1]
+    show("Reverse side:", rd.inverted.get_many(['value7', 7]))  # [7, 'value7']
+    try:
+        import numpy as np
+    except ImportError:
+        return True, "test_get_many"
+    cm = CompactReverseMap(((i, i * 2) for i in range(1_000)), size_hint=1_000)
+    probes = np.array([4, 1_001, 3_000], dtype=np.int64)
+    show("Vectorized:", cm.get_many(probes, default=-1))  # [8 -1 -1]; 1001 is odd, so it is no value
+    show("Vectorized reverse:", cm.inverse_get_many(probes, default=-1))  # [2 -1 -1]
+    assert cm.get_many(probes, default=-1).tolist() == cm.get_many(probes.tolist(), default=-1)
+    return True, "test_get_many"
+
+
+def test_mapped():
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(100_000))
+    rd['config'] = {'retries': [1, 2], 'hosts': {'a', 'b'}}
+    hosts = [f"host{i}" for i in range(8)]
+    rd['cluster'] = {'hosts': set(hosts)}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'map.rmap')
+        MappedReverseMap.compile(rd, path).close()
+        start = time.perf_counter()
+        mapped = MappedReverseMap(path)
+        elapsed = time.perf_counter() - start
+        show("Open 100k pairs (seconds):", elapsed)
+        assert elapsed < 0.01, "opening a mapped file reads more than its header"
+        show("Mapped lookups:", mapped[5], mapped['value5'], mapped['config'])  # value5 5 {...}
+        show("Unhashable value:", mapped[{'hosts': {'b', 'a'}, 'retries': [1, 2]}])  # config
+        assert len(mapped) == len(rd) and 'missing' not in mapped
+        # Other hash seeds order sets differently, so hashing must not depend on them
+        script = (
+            "from ReverseMap.mapped import MappedReverseMap; "
+            f"mapped = MappedReverseMap({path!r}); "
+            f"print(mapped['value7'], mapped.get({{'hosts': set({hosts[::-1]!r})}}))"
+        )
+        for seed in ('1', '2'):
+            output = subprocess.run(
+                [sys.executable, '-c', script],
+                capture_output=True,
+                text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path), 'PYTHONHASHSEED': seed},
+            ).stdout
+            show(f"Lookups from a process with hash seed {seed}:", output.strip())  # 7 cluster
+            assert output.split() == ['7', 'cluster']
+        mapped.close()
+    return True, "test_mapped"
+
+
+def test_pickle():
+    rd = ReverseMap.from_pairs((i, {'id': i, 'tags': [f"t{i}"]}) for i in range(1_000))
+    rd[{'id': 0, 'tags': ['t0']}]  # hash the probe once
+    restored = pickle.loads(pickle.dumps(rd, protocol=pickle.HIGHEST_PROTOCOL))
+    frozen = [c._frozen is not convert_module._UNFROZEN for c in restored._convertible_map.values()]
+    show("Restored without re-freezing:", all(frozen))  # True
+    assert all(frozen), "unpickling re-froze the values"
+    show("Restored lookups:", restored[{'id': 7, 'tags': ['t7']}], restored[7])  # 7 {...}
+    shallow = copy.copy(restored)
+    shallow['extra'] = 'pair'
+    show("Copies own their indexes:", 'pair' in restored, 'pair' in shallow)  # False True
+    deep = copy.deepcopy(rd)
+    deep[3]['id'] = -1
+    show("Deep copy is independent:", rd[3]['id'])  # 3
+    cm = CompactReverseMap(((i, f"v{i}") for i in range(1_000)), value_type=str)
+    buffers = []
+    data = pickle.dumps(cm, protocol=5, buffer_callback=buffers.append)
+    show("Out-of-band buffers:", len(buffers), len(data))  # 6 and a small pickle
+    restored_compact = pickle.loads(data, buffers=buffers)
+    assert restored_compact['v5'] == 5 and restored_compact[5] == 'v5'
+    return True, "test_pickle"
+
+
+def test_concurrent():
+    rd = ConcurrentReverseMap.from_pairs((i, f"value{i}") for i in range(1_000))
+    errors = []
+    done = threading.Event()
+
+    def writer(base):
+        n = 0
+        while not done.is_set():
+            n += 1
+            key = base + n % 10
+            rd[key] = f"moved{base}-{n}"
+            rd.pop(f"moved{base}-{n}")
+            rd[key] = f"value{key}"
+
+    def reader():
+        try:
+            while not done.is_set():
+                for i in range(100, 1_000, 7):
+                    assert rd[i] == f"value{i}" and rd[f"value{i}"] == i
+                    assert rd.invert()[f"value{i}"] == i
+        except Exception as error:
+            errors.append(error)
+
+    def walker():
+        # The views walk snapshots, so writers resizing the map cannot break them
+        try:
+            while not done.is_set():
+                for _ in rd.items():
+                    pass
+                sum(1 for _ in rd.keys()) + sum(1 for _ in rd.values())
+        except Exception as error:
+            errors.append(error)
+
+    def inverted_writer(base):
+        # Writes through the inverted view take the same lock
+        inverted = rd.invert()
+        n = 0
+        while not done.is_set():
+            n += 1
+            key = base + n % 10
+            inverted[f"moved{base}-{n}"] = key
+            del inverted[f"moved{base}-{n}"]
+            inverted[f"value{key}"] = key
+
+    threads = [threading.Thread(target=writer, args=(base,)) for base in (0, 10)]
+    threads += [threading.Thread(target=inverted_writer, args=(base,)) for base in (20, 30)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    threads.append(threading.Thread(target=walker))
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    done.set()
+    for thread in threads:
+        thread.join()
+    show("Reader errors under concurrent writes:", errors)  # []
+    assert not errors and rd._version % 2 == 0
+    assert len(rd._inverse) == len(dict.keys(rd)) == 1_000, "a write was left half-done"
+    restored = pickle.loads(pickle.dumps(rd))
+    show("Pickled with a fresh lock:", restored['value5'], restored._version)  # 5 0
+    return True, "test_concurrent"
+
+
+def test_aload():
+    async def rows(count):
+        for i in range(count):
+            yield i, {'id': i, 'tags': [f"t{i}"]}
+
+    async def watch(done, gaps):
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    async def load(executor=None):
+        done, gaps = asyncio.Event(), []
+        watcher = asyncio.create_task(watch(done, gaps))
+        start = time.perf_counter()
+        rd = await ReverseMap.aload(rows(50_000), chunk_size=512, executor=executor)
+        elapsed = time.perf_counter() - start
+        done.set()
+        await watcher
+        return rd, elapsed, max(gaps)
+
+    rd, elapsed, stall = asyncio.run(load())
+    show("aload 50k (seconds, longest loop stall):", elapsed, stall)
+    assert stall < elapsed / 2, "aload blocked the event loop"
+    show("Loaded:", rd[{'id': 7, 'tags': ['t7']}], len(dict.keys(rd)))  # 7 50000
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rd, elapsed, stall = asyncio.run(load(executor))
+    show("aload with an executor (seconds, longest loop stall):", elapsed, stall)
+    assert rd[49_999] == {'id': 49_999, 'tags': ['t49999']}
+
+    async def extend():
+        extended = ReverseMap({'a': 1})
+        await extended.aupdate({'b': [2]})
+        return extended
+
+    show("aupdate:", asyncio.run(extend())[[2]])  # b
+    return True, "test_aload"
+
+
+def test_parallel_load():
+    rows = [(i, {'id': i, 'tags': [f"t{i}"]}) for i in range(5_000)] + [('s', 'scalar')]
+    rd = ReverseMap.from_pairs(rows, workers=2)
+    show("Parallel load:", rd[{'id': 7, 'tags': ['t7']}], rd['scalar'], len(dict.keys(rd)))  # 7 s 5001
+    assert rd[4_999] == {'id': 4_999, 'tags': ['t4999']}
+    assert rd[{'tags': ['t42'], 'id': 42}] == 42
+    assert dict(rd) == dict(ReverseMap.from_pairs(rows))
+
+    class Tagged:
+        def __init__(self, tag):
+            self.tag = tag
+
+    # A spawned worker would not have this freezer, so the hashes it sends are wrong
+    from concurrent.futures import Future
+
+    stale = Future()
+    stale.set_result((rd_module._hash_probe(), [0]))
+    convert_module.register_freezer(Tagged, lambda obj: ('tagged', obj.tag))
+    try:
+        tagged = ReverseMap()
+        tagged._merge_hashed([('t', [Tagged('x')])], stale, rd_module._hash_probe())
+        show("Hashes from a worker with other freezers are redone:", tagged.get([Tagged('x')]))  # t
+        assert tagged.get([Tagged('x')]) == 't'
+        # Without fork, a spawned worker's probe lacks the freezer and the load stays here
+        import multiprocessing
+
+        merges = []
+        start_methods, merge = multiprocessing.get_all_start_methods, ReverseMap._merge_hashed
+        multiprocessing.get_all_start_methods = lambda: ['spawn']
+        ReverseMap._merge_hashed = lambda self, *args: merges.append(args) or merge(self, *args)
+        try:
+            spawned = ReverseMap.from_pairs(((i, [Tagged(i)]) for i in range(100)), workers=1)
+        finally:
+            multiprocessing.get_all_start_methods, ReverseMap._merge_hashed = start_methods, merge
+        show("Spawned pool with other freezers loads in-process:", spawned.get([Tagged(7)]), merges)  # 7 []
+        assert spawned.get([Tagged(7)]) == 7 and merges == [] and len(spawned) == 100
+    finally:
+        del convert_module._FREEZERS[Tagged]
+        convert_module._freezer_cache.clear()
+    return True, "test_parallel_load"
+
+
+def test_shared():
+    name = f"rmap-test-{os.getpid()}"
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(10_000))
+    rd['config'] = {'retries': [1, 2]}
+    hosts = [f"host{i}" for i in range(8)]
+    rd['cluster'] = {'hosts': set(hosts)}
+    with SharedReverseMapPublisher(name, rd) as publisher:
+        replica = SharedReverseMap(name)
+        show("Replica lookups:", replica[5], replica['value5'], replica[{'retries': [1, 2]}])  # value5 5 config
+        # Other hash seeds order sets differently; replicas attach without copying
+        script = (
+            "from ReverseMap.shared import SharedReverseMap; "
+            f"replica = SharedReverseMap({name!r}); "
+            f"print(replica['value7'], replica.get({{'hosts': set({hosts[::-1]!r})}})); "
+            "replica.close()"
+        )
+        for seed in ('1', '2'):
+            output = subprocess.run(
+                [sys.executable, '-c', script],
+                capture_output=True,
+                text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path), 'PYTHONHASHSEED': seed},
+            ).stdout
+            show(f"Lookups from a replica with hash seed {seed}:", output.strip())  # 7 cluster
+            assert output.split() == ['7', 'cluster']
+        pairs = iter(replica.items())
+        next(pairs)
+        stale = SharedReverseMap(name)
+        publisher.publish({'a': 'b'})
+        show("Swapped version:", replica.version, replica['b'], 'value5' in replica)  # 2 a False
+        assert replica.version == 2 and len(replica) == 1
+        show("Iteration keeps its version:", next(pairs))  # (1, 'value1')
+        replica.close()
+    try:
+        stale['b']
+    except FileNotFoundError as e:
+        show("Reader of a closed publisher gives up:", e)
+    else:
+        raise AssertionError("a reader kept retrying a version that is gone")
+    finally:
+        stale.close()
+    return True, "test_shared"
+
+
+def test_stats():
+    rd = ReverseMap({'x': 'apple', 'y': [1, 2]}, _normalizer='casefold')
+    assert rd.stats() is None
+    seen = []
+    rd.enable_stats(lambda tier, elapsed: seen.append(tier))
+    rd['x'], rd['apple'], rd[[1, 2]], rd['APPLE'], 'missing' in rd
+    info = rd.stats()
+    show("Hits per tier:", info['hits'], "misses:", info['misses'])
+    assert info['hits']['instance'] == 1 and info['hits']['inverse'] == 2
+    assert info['hits']['normalized_values'] == 1 and info['misses'] == 1
+    assert seen == ['instance', 'inverse', 'inverse', 'normalized_values', None]
+    show("Latency (p50, p99 ns):", info['p50_ns'], info['p99_ns'], "freezes:", info['freezes'])
+    assert sum(info['latency_ns'].values()) == info['lookups'] == 5
+    show("Batch lookups are counted:", rd.get_many(['x', 'apple', 'nope']))  # ['apple', 'x', None]
+    info = rd.stats()
+    assert info['lookups'] == 8 and info['hits']['instance'] == 2 and info['misses'] == 2
+    assert info['hits']['inverse'] == 3
+    restored = pickle.loads(pickle.dumps(rd))
+    show("Stats are not pickled:", restored.stats())  # None
+    rd.disable_stats()
+    assert rd.stats() is None and rd['x'] == 'apple'
+    return True, "test_stats"
+
+
+def test_quiet_miss():
+    rd = ReverseMap.from_pairs((i, f"value{i}") for i in range(100_000))
+    rd['none'] = None
+    show("get both ways:", rd.get(5), rd.get('value5'), rd.get('missing', 'default'))  # value5 5 default
+    show("lookup:", rd.lookup('none'), rd.lookup('missing'))  # None MISSING
+    assert rd.lookup('missing') is MISSING and rd.lookup([1, 2]) is MISSING
+    assert rd.invert().lookup('value5') == 5 and rd.invert().lookup('missing') is MISSING
+    hits = [f"value{i}" for i in range(100_000)]
+    misses = [f"other{i}" for i in range(100_000)]
+    start = time.perf_counter()
+    for key in hits:
+        rd.get(key)
+    hit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in misses:
+        rd.get(key)
+    miss_time = time.perf_counter() - start
+    show("100k reverse hits and misses through get (seconds):", hit_time, miss_time)
+    assert miss_time < 2 * hit_time, "misses cost more than hits"
+    return True, "test_quiet_miss"
+
+
+def test_light_import():
+    # A fresh interpreter, so modules other tests loaded do not hide what the import pulls in
+    script = (
+        "import sys; path = list(sys.path); import ReverseMap.reverse; "
+        "print(path == sys.path, *sorted(sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+    )
+    unchanged, *modules = result.stdout.split()
+    heavy = {'ReverseMap._util', 'asyncio', 'colorama', 'concurrent.futures', 'shlex'}
+    show("sys.path untouched:", unchanged, "heavy modules:", heavy & set(modules))  # True set()
+    assert unchanged == 'True' and not heavy & set(modules)
+    cumulative = next(
+        line.split('|')[1] for line in result.stderr.splitlines() if line.endswith('| ReverseMap.reverse')
+    )
+    show("Import ReverseMap.reverse (us):", int(cumulative))
+    return True, "test_light_import"
+
+
+def test_multimap():
+    rd = ReverseMultiMap({'alice': 'admin', 'bob': 'admin', 'carol': 'user'})
+    rd['dave'] = {'team': ['ops']}
+    rd['erin'] = {'team': ['ops']}
+    show("Keys per value:", list(rd.keys_for('admin')), list(rd.keys_for({'team': ['ops']})))  # alice bob, dave erin
+    show("Counts:", rd.count('admin'), rd.count('user'), rd.count('missing'))  # 2 1 0
+    assert rd['admin'] == 'bob' and rd['alice'] == 'admin'
+    rd['bob'] = 'user'
+    show("Moved key:", list(rd.keys_for('admin')), list(rd.keys_for('user')), rd['admin'])  # alice, carol bob, alice
+    assert rd['user'] == 'bob' and rd.count('admin') == 1
+    del rd['bob']
+    show("Value falls back to the latest key left:", rd['user'])  # carol
+    assert rd['user'] == 'carol' and list(rd.keys_for('user')) == ['carol']
+    restored = pickle.loads(pickle.dumps(rd))
+    shallow = copy.copy(rd)
+    shallow['frank'] = 'admin'
+    assert restored.count('admin') == rd.count('admin') == 1 and shallow.count('admin') == 2
+    pies = ReverseMultiMap({'a': 'Pie', 'b': 'PIE'}, _normalizer='casefold')
+    show("Variants share a bucket:", list(pies.keys_for('pie')), pies.count('Pie'))  # ['a', 'b'] 2
+    assert list(pies.keys_for('pie')) == ['a', 'b'] and pies['pie'] == 'b'
+    del pies['b']
+    show("Variant left after a delete:", pies.get('pie'), list(pies.keys_for('PIE')))  # a ['a']
+    assert pies.get('pie') == 'a' and pies.count('pie') == 1
+    big = ReverseMultiMap.from_pairs((i, i % 10) for i in range(100_000))
+    start = time.perf_counter()
+    for value in range(10):
+        big.count(value)
+    elapsed = time.perf_counter() - start
+    show("Count 10 buckets of 10k keys (seconds):", elapsed)
+    assert big.count(3) == 10_000 and elapsed < 0.01, "count enumerates the keys"
+    return True, "test_multimap"
+
+
 def run_tests():
     results = []
     tests = [
@@ -339,6 +1110,32 @@ def run_tests():
         test_convertible1(),
         test_chainmap(),
         test_rdict(),
+        test_setitem_scaling(),
+        test_bulk_load(),
+        test_rejected_pairs(),
+        test_convertible_lazy(),
+        test_bidirectional_lookup(),
+        test_membership_scaling(),
+        test_live_views(),
+        test_normalizer(),
+        test_freeze_cache(),
+        test_deep_freeze(),
+        test_custom_freezers(),
+        test_delete_scaling(),
+        test_shared_value_delete(),
+        test_invert_view(),
+        test_compact(),
+        test_get_many(),
+        test_mapped(),
+        test_pickle(),
+        test_concurrent(),
+        test_aload(),
+        test_parallel_load(),
+        test_shared(),
+        test_stats(),
+        test_quiet_miss(),
+        test_light_import(),
+        test_multimap(),
     ]
     for t in tests:
         if not t:
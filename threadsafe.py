@@ -0,0 +1,150 @@
+from __future__ import annotations
+import threading
+
+from collections.abc import Callable, ItemsView, Iterable, Iterator, KeysView, ValuesView
+from functools import wraps
+from typing import Any
+
+from ReverseMap.reverse import ReverseMap
+
+
+_OPTIMISTIC_READS = 4
+_LOCK_ATTRIBUTES = ('_lock', '_version', '_writers')
+
+
+def _write(method: Callable) -> Callable:
+    """
+    Run method under the writer lock, with the version odd while it runs.
+    Nested writes, such as update calling __setitem__, bump the version once.
+    """
+
+    @wraps(method)
+    def write(self, *args, **kwds):
+        with self._lock:
+            if self._writers:
+                return method(self, *args, **kwds)
+            self._writers = 1
+            self._version += 1
+            try:
+                return method(self, *args, **kwds)
+            finally:
+                self._version += 1
+                self._writers = 0
+
+    return write
+
+
+class ConcurrentReverseMap(ReverseMap):
+    """
+    A ReverseMap that can be shared between threads.
+
+    Writers serialize on one lock and keep a version counter odd while they touch
+    the forward map and the reverse indexes, so a pair is never published half-done.
+    Readers take no lock: a lookup runs optimistically and is kept only if the version
+    was even and unchanged around it (a seqlock). A read that keeps racing with writers
+    falls back to the lock. Iteration and the keys, values and items views walk a
+    snapshot taken under the lock.
+    """
+
+    def __init__(self, *args, **kwds):
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writers = 0
+        super().__init__(*args, **kwds)
+
+    def _read(self, read: Callable[[], Any]) -> Any:
+        for _ in range(_OPTIMISTIC_READS):
+            version = self._version
+            if version & 1:
+                continue
+            try:
+                result = read()
+            except Exception:
+                # A torn read can fail; only a failure on a stable version is real
+                if self._version == version:
+                    raise
+                continue
+            if self._version == version:
+                return result
+        with self._lock:
+            return read()
+
+    def _resolve(self, key, default=None):
+        # The first optimistic attempt is inlined; retries go through _read
+        version = self._version
+        if not version & 1:
+            try:
+                result = ReverseMap._resolve(self, key, default)
+            except Exception:
+                if self._version == version:
+                    raise
+            else:
+                if self._version == version:
+                    return result
+        return self._read(lambda: ReverseMap._resolve(self, key, default))
+
+    def get_many(self, keys: Iterable, default=None) -> list[Any]:
+        """Resolve a batch of keys or values against one consistent version of the map."""
+        keys = list(keys)
+        get_many = super().get_many
+        return self._read(lambda: get_many(keys, default))
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def _snapshot(self) -> dict:
+        """A copy of the forward map taken under the lock, for views writers cannot resize."""
+        with self._lock:
+            return dict(dict.items(self))
+
+    def keys(self) -> KeysView:
+        return self._snapshot().keys()
+
+    def values(self) -> ValuesView:
+        return self._snapshot().values()
+
+    def items(self) -> ItemsView:
+        return self._snapshot().items()
+
+    def __len__(self) -> int:
+        return dict.__len__(self)
+
+    _load = _write(ReverseMap._load)
+    _load_frozen = _write(ReverseMap._load_frozen)
+    __setitem__ = _write(ReverseMap.__setitem__)
+    __delitem__ = _write(ReverseMap.__delitem__)
+    _unlink = _write(ReverseMap._unlink)
+    _unlink_inverse = _write(ReverseMap._unlink_inverse)
+    pop = _write(ReverseMap.pop)
+    popitem = _write(ReverseMap.popitem)
+    clear = _write(ReverseMap.clear)
+    update = _write(ReverseMap.update)
+    setdefault = _write(ReverseMap.setdefault)
+    __ior__ = _write(ReverseMap.__ior__)
+    set_normalizer = _write(ReverseMap.set_normalizer)
+
+    def __copy__(self) -> ConcurrentReverseMap:
+        with self._lock:
+            return super().__copy__()
+
+    def __deepcopy__(self, memo: dict) -> ConcurrentReverseMap:
+        with self._lock:
+            return super().__deepcopy__(memo)
+
+    def __getstate__(self):
+        with self._lock:
+            *indexes, attributes = super().__getstate__()
+        attributes = {
+            name: value for name, value in attributes.items() if name not in _LOCK_ATTRIBUTES
+        }
+        return (*indexes, attributes)
+
+    def __setstate__(self, state) -> None:
+        self._lock = threading.RLock()
+        self._version = 0
+        self._writers = 0
+        super().__setstate__(state)
+
+    def __repr__(self) -> str:
+        return f"ConcurrentReverseMap({dict.__repr__(self)})"